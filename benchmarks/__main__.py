@@ -0,0 +1,93 @@
+"""基准测试入口
+
+在项目根目录运行：
+    python -m benchmarks                  # 运行并与基线比较，没有基线时返回 2
+    python -m benchmarks --save-baseline  # 运行并更新基线
+    python -m benchmarks -k capture       # 只运行名称包含 capture 的用例
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# 无界面运行，必须在导入 PyQt5 之前设置
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# 运行时会切换工作目录，提前固定项目根目录以便导入 src.erchong
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from .harness import (  # noqa: E402
+    SkipCase,
+    check_budget,
+    check_regression,
+    get_cases,
+    load_baseline,
+    run_case,
+    save_baseline,
+)
+
+BASELINE_FILE = Path(__file__).parent / "baseline.json"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("-k", dest="pattern", default="", help="只运行名称包含该字符串的用例")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE, help="基线文件路径")
+    parser.add_argument("--save-baseline", action="store_true", help="将本次结果写入基线")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="允许的回退比例")
+    parser.add_argument("--repeat", type=int, default=5, help="计时轮数")
+    args = parser.parse_args()
+
+    # 日志文件使用相对路径，切换到临时目录以免污染项目的 logs/
+    os.chdir(tempfile.mkdtemp(prefix="erchong-bench-"))
+
+    from . import cases  # noqa: F401  注册用例
+
+    baseline = load_baseline(args.baseline)
+    if not baseline and not args.save_baseline:
+        # 没有基线时比较没有意义，不能当作通过
+        print(f"❌ 未找到基线，先在运行检查的机器上使用 --save-baseline 生成 path:{args.baseline}")
+        return 2
+
+    results = []
+    failed = False
+
+    print(f"{'用例':<28}{'ops/sec':>14}{'allocs/op':>12}{'bytes/op':>14}{'leak/op':>10}")
+    for case in get_cases(args.pattern):
+        try:
+            result = run_case(case, args.repeat)
+        except ImportError as e:
+            # Windows 专用依赖（win32gui 等）缺失时跳过
+            print(f"{case.name:<28}  跳过: 缺少依赖 {e.name}")
+            continue
+        except SkipCase as e:
+            print(f"{case.name:<28}  跳过: {e}")
+            continue
+
+        results.append(result)
+        print(
+            f"{result.name:<28}{result.ops_per_sec:>14,.0f}{result.allocs_per_op:>12.1f}"
+            f"{result.alloc_bytes_per_op:>13,.0f}B{result.blocks_per_op:>10.2f}"
+        )
+        problems = [f"超出上限: {p}" for p in check_budget(case, result)]
+        if not args.save_baseline:
+            base = baseline.get(result.name)
+            if base is None:
+                problems.append("基线中没有该用例，使用 --save-baseline 更新")
+            else:
+                problems += [f"回退: {p}" for p in check_regression(result, base, args.tolerance)]
+        for problem in problems:
+            failed = True
+            print(f"  ❌ {problem}")
+
+    if args.save_baseline:
+        save_baseline(args.baseline, results)
+        print(f"✅ 基线已保存 path:{args.baseline}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
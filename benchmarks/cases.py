@@ -0,0 +1,199 @@
+"""基准用例
+
+全部使用合成数据，无需真实窗口或屏幕即可运行。
+"""
+
+import atexit
+import logging
+import multiprocessing
+import os
+import signal
+import uuid
+
+from .harness import SkipCase, benchmark
+
+# 合成帧尺寸
+FRAME_WIDTH = 1920
+FRAME_HEIGHT = 1080
+
+# capture 默认截取 (500, 500, 700, 700)，即 200x200 区域
+CAPTURE_SIZE = 200
+
+# 与配置项 Screenshot.Compression 的默认值一致
+PNG_COMPRESSION = 1
+
+# 合成窗口列表长度
+WINDOW_COUNT = 5000
+
+# 控制接口单次调用的耗时上限（秒）
+IPC_CALL_BUDGET = 0.001
+
+
+def _ensure_app():
+    """确保存在 QApplication（部件类用例需要）"""
+    from PyQt5.QtWidgets import QApplication
+
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def _synthetic_frame(width: int, height: int, channels: int = 4) -> memoryview:
+    """生成带渐变内容的合成帧"""
+    row = bytes((x * 7) & 0xFF for x in range(width * channels))
+    data = bytearray(row * height)
+    return memoryview(data).cast("B", (height, width, channels))
+
+
+@benchmark("capture.frame_to_qimage", number=200)
+def bench_frame_to_qimage():
+    """全高清 BGRA 帧转换为 QImage"""
+    from src.erchong.utils.image import frame_to_qimage
+
+    frame = _synthetic_frame(FRAME_WIDTH, FRAME_HEIGHT)
+    return lambda: frame_to_qimage(frame)
+
+
+def _encode_case(options_factory):
+    """截图区域按导出参数编码（与导出器编码任务相同的路径）"""
+    from src.erchong.capture.exporter import encode_image
+    from src.erchong.utils.image import frame_to_qimage
+
+    frame = _synthetic_frame(CAPTURE_SIZE, CAPTURE_SIZE, 3)
+    options = options_factory()
+
+    def op():
+        return encode_image(frame_to_qimage(frame), options)
+
+    return op
+
+
+@benchmark("capture.encode_png", number=100)
+def bench_encode_png():
+    """PNG 编码，使用配置中默认的压缩级别"""
+    from src.erchong.capture.exporter import ExportFormat, ExportOptions
+
+    return _encode_case(lambda: ExportOptions(ExportFormat.PNG, compression=PNG_COMPRESSION))
+
+
+@benchmark("capture.encode_bmp", number=500)
+def bench_encode_bmp():
+    """BMP 编码（无压缩的快速路径）"""
+    from src.erchong.capture.exporter import ExportFormat, ExportOptions
+
+    return _encode_case(lambda: ExportOptions(ExportFormat.BMP))
+
+
+@benchmark("capture.encode_raw", number=2000)
+def bench_encode_raw():
+    """RAW 导出（只加文件头，不编码）"""
+    from src.erchong.capture.exporter import ExportFormat, ExportOptions
+
+    return _encode_case(lambda: ExportOptions(ExportFormat.RAW))
+
+
+@benchmark("hwnd_list.apply_filter", number=20)
+def bench_apply_filter():
+    """在大量窗口中按标题过滤"""
+    _ensure_app()
+    from src.erchong.widgets.hwnd_list_widget import HwndListWidget
+
+    widget = HwndListWidget()
+    widget._windows = [
+        (0x10000 + i, f"Window {i} - {'Game' if i % 7 == 0 else 'Explorer'}")
+        for i in range(WINDOW_COUNT)
+    ]
+    widget.filter_edit.blockSignals(True)
+    widget.filter_edit.setText("game")
+    widget.filter_edit.blockSignals(False)
+    return widget._apply_filter
+
+
+@benchmark("config.qss_load", number=2000)
+def bench_qss_load():
+    """读取部件 QSS 文件"""
+    from src.erchong.common.config import cfg
+
+    return lambda: cfg.getQssFile("hwnd_list_widget")
+
+
+@benchmark("logger.debug", number=5000)
+def bench_logger():
+    """通过 app 日志器输出一条 DEBUG 日志（包含所有文件 handler）"""
+    from src.erchong.utils.logger import get_logger
+
+    log = get_logger()
+    # 控制台输出会淹没报告，且终端速度不代表日志开销
+    devnull = open(os.devnull, "w", encoding="utf-8")
+    for handler in log.handlers:
+        if type(handler) is logging.StreamHandler:
+            handler.setStream(devnull)
+
+    return lambda: log.debug("benchmark message %d %s", 42, "payload")
+
+
+def _serve_ipc(name: str, ready):
+    """控制服务进程：截图函数返回固定的合成帧"""
+    from src.erchong.daemon import create_core_app
+    from src.erchong.ipc import ControlServer
+
+    app = create_core_app([])
+    frame = _synthetic_frame(CAPTURE_SIZE, CAPTURE_SIZE)
+    server = ControlServer(name, capture=lambda *_: frame, parent=app)
+    if server.start():
+        ready.set()
+    app.aboutToQuit.connect(server.close)
+    app.exec_()
+
+
+_ipc_client = None
+
+
+def _stop_process(process):
+    """Ctrl+C 让服务端正常退出并释放共享内存"""
+    os.kill(process.pid, signal.SIGINT)
+    process.join(5)
+
+
+def _ipc_connect():
+    """在子进程中启动控制服务并连接，多个用例共用"""
+    global _ipc_client
+    if _ipc_client is not None:
+        return _ipc_client
+
+    from src.erchong.ipc import ControlClient
+
+    name = f"erchong_bench_{uuid.uuid4().hex[:8]}"
+    context = multiprocessing.get_context("spawn")
+    ready = context.Event()
+    process = context.Process(target=_serve_ipc, args=(name, ready), daemon=True)
+    process.start()
+    atexit.register(_stop_process, process)
+    if not ready.wait(30):
+        raise SkipCase("控制服务未能启动")
+
+    _ipc_client = ControlClient(name)
+    _ipc_client.connect()
+    atexit.register(_ipc_client.close)
+    return _ipc_client
+
+
+@benchmark("ipc.ping", number=2000, budget=IPC_CALL_BUDGET)
+def bench_ipc_ping():
+    """控制接口往返一次 PING"""
+    client = _ipc_connect()
+    return lambda: client.ping(b"ping")
+
+
+@benchmark("ipc.capture", number=1000, budget=IPC_CALL_BUDGET)
+def bench_ipc_capture():
+    """控制接口截图，帧数据经共享内存读取"""
+    client = _ipc_connect()
+
+    def op():
+        frame = client.capture(0, 500, 500, CAPTURE_SIZE, CAPTURE_SIZE)
+        # 读取帧数据以包含共享内存访问
+        return frame.data[-1]
+
+    return op
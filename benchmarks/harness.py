@@ -0,0 +1,186 @@
+"""基准测试框架
+
+每个用例是一个 setup 函数，返回一次操作的可调用对象。框架负责计时、
+统计内存分配，并与保存的基线比较。分配统计基于 tracemalloc，
+只包含 Python 分配器的内存，不含 Qt 等 C++ 库自行分配的内存。
+"""
+
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+# 已注册的用例：名称 -> (setup, 每轮操作次数)
+_CASES: Dict[str, "Case"] = {}
+
+# 分配统计抽样的操作次数，每次操作前后各取一次快照，较慢
+ALLOC_SAMPLES = 20
+
+
+@dataclass
+class Case:
+    """基准用例"""
+
+    name: str
+    setup: Callable[[], Callable[[], object]]
+    number: int
+    # 单次操作耗时上限（秒），不依赖基线
+    budget: Optional[float] = None
+
+
+@dataclass
+class BenchResult:
+    """基准结果"""
+
+    name: str
+    ops_per_sec: float
+    # 单次操作分配的内存块数（到操作返回时仍存活的，含返回值）
+    allocs_per_op: float
+    # 单次操作期间 Python 内存的峰值增量（字节）
+    alloc_bytes_per_op: float
+    # 整轮操作结束后仍存活的内存块数，按操作次数平均（用于发现泄漏）
+    blocks_per_op: float
+
+
+class SkipCase(Exception):
+    """当前环境无法运行该用例"""
+
+
+def benchmark(name: str, number: int = 1000, budget: Optional[float] = None):
+    """注册基准用例的装饰器，budget 为单次操作耗时上限（秒）"""
+
+    def decorator(setup: Callable[[], Callable[[], object]]):
+        _CASES[name] = Case(name, setup, number, budget)
+        return setup
+
+    return decorator
+
+
+def get_cases(pattern: str = "") -> List[Case]:
+    """获取名称包含 pattern 的用例"""
+    return [case for name, case in _CASES.items() if pattern in name]
+
+
+def run_case(case: Case, repeat: int = 5) -> BenchResult:
+    """运行单个用例"""
+    op = case.setup()
+
+    # 预热
+    for _ in range(max(1, case.number // 10)):
+        op()
+
+    # 计时：取多轮中最快的一轮，降低调度抖动的影响
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(case.number):
+            op()
+        best = min(best, time.perf_counter() - start)
+
+    # 分配统计：单独进行，避免 tracemalloc 的开销影响计时
+    allocs, alloc_bytes = _measure_allocations(op, min(case.number, ALLOC_SAMPLES))
+
+    # 泄漏检查：整轮操作后仍存活的块数
+    gc.collect()
+    blocks_before = sys.getallocatedblocks()
+    for _ in range(case.number):
+        op()
+    gc.collect()
+    blocks_after = sys.getallocatedblocks()
+
+    return BenchResult(
+        name=case.name,
+        ops_per_sec=case.number / best if best > 0 else float("inf"),
+        allocs_per_op=allocs,
+        alloc_bytes_per_op=alloc_bytes,
+        blocks_per_op=max(0, blocks_after - blocks_before) / case.number,
+    )
+
+
+def _measure_allocations(op: Callable[[], object], samples: int) -> Tuple[float, float]:
+    """抽样测量单次操作的分配块数与内存峰值增量，返回平均值"""
+
+    def count_blocks(func: Callable[[], object]) -> int:
+        before = tracemalloc.take_snapshot()
+        # 持有返回值直到快照完成，返回的对象也计入分配
+        result = func()  # noqa: F841
+        after = tracemalloc.take_snapshot()
+        return sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+
+    tracemalloc.start()
+    try:
+        # 快照本身带来的块数偏差
+        overhead = min(count_blocks(lambda: None) for _ in range(3))
+        blocks = 0
+        peak_bytes = 0
+        for _ in range(samples):
+            blocks += max(0, count_blocks(op) - overhead)
+
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            op()
+            _, peak = tracemalloc.get_traced_memory()
+            peak_bytes += max(0, peak - current)
+    finally:
+        tracemalloc.stop()
+    return blocks / samples, peak_bytes / samples
+
+
+def load_baseline(path: Path) -> Dict[str, dict]:
+    """读取基线文件，不存在时返回空字典"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def save_baseline(path: Path, results: List[BenchResult]):
+    """保存基线，保留未运行用例的旧记录"""
+    baseline = load_baseline(path)
+    for result in results:
+        baseline[result.name] = asdict(result)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, indent=4, ensure_ascii=False)
+
+
+def check_regression(
+    result: BenchResult, base: Optional[dict], tolerance: float
+) -> List[str]:
+    """与基线比较，返回回退描述列表"""
+    if not base:
+        return []
+
+    problems = []
+    if result.ops_per_sec < base["ops_per_sec"] * (1 - tolerance):
+        problems.append(
+            f"ops/sec {result.ops_per_sec:,.0f} < 基线 {base['ops_per_sec']:,.0f}"
+        )
+    # 块数基线可能为 0，额外允许 1 个块的误差
+    if result.allocs_per_op > base["allocs_per_op"] * (1 + tolerance) + 1:
+        problems.append(
+            f"allocs/op {result.allocs_per_op:.1f} > 基线 {base['allocs_per_op']:.1f}"
+        )
+    if result.alloc_bytes_per_op > base["alloc_bytes_per_op"] * (1 + tolerance) + 64:
+        problems.append(
+            f"bytes/op {result.alloc_bytes_per_op:,.0f}B > 基线 {base['alloc_bytes_per_op']:,.0f}B"
+        )
+    if result.blocks_per_op > base["blocks_per_op"] * (1 + tolerance) + 1:
+        problems.append(
+            f"leak/op {result.blocks_per_op:.2f} > 基线 {base['blocks_per_op']:.2f}"
+        )
+    return problems
+
+
+def check_budget(case: Case, result: BenchResult) -> List[str]:
+    """检查单次操作耗时是否超过用例的上限"""
+    if case.budget is None or result.ops_per_sec <= 0:
+        return []
+    per_op = 1 / result.ops_per_sec
+    if per_op > case.budget:
+        return [f"单次 {per_op * 1e6:,.0f}us > 上限 {case.budget * 1e6:,.0f}us"]
+    return []
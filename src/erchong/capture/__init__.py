@@ -0,0 +1,14 @@
+"""截图模块
+
+geometry 与 screen 依赖 Win32 API，需从子模块导入：
+    from src.erchong.capture.screen import capture_rect, capture_rois
+"""
+
+from .exporter import ExportFormat, ExportOptions, ScreenshotExporter, get_exporter
+
+__all__ = [
+    "ExportFormat",
+    "ExportOptions",
+    "ScreenshotExporter",
+    "get_exporter",
+]
@@ -0,0 +1,268 @@
+"""截图导出管线
+
+在线程池中编码内存中的帧，由单独的写入线程批量落盘，
+完成情况通过信号通知，GUI 线程只负责提交。
+"""
+
+import os
+import queue
+import struct
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import List, Optional, Tuple
+
+from PyQt5.QtCore import (
+    QBuffer,
+    QByteArray,
+    QCoreApplication,
+    QIODevice,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    pyqtSignal,
+)
+from PyQt5.QtGui import QImage, QImageWriter
+
+from ..config.settings import SCREENSHOT_DIR
+from ..utils.image import frame_to_qimage
+from ..utils.logger import get_logger
+
+log = get_logger()
+
+# RAW 文件头：魔数、宽、高、每行字节数、QImage 格式
+RAW_HEADER = struct.Struct("<4sIIII")
+RAW_MAGIC = b"ECRW"
+
+
+class ExportFormat(Enum):
+    """导出格式"""
+
+    PNG = "png"
+    JPEG = "jpg"
+    WEBP = "webp"
+    # 无压缩位图，编码最快的无损格式
+    BMP = "bmp"
+    # 原始像素加文件头，不做任何编码
+    RAW = "raw"
+
+
+@dataclass(frozen=True)
+class ExportOptions:
+    """导出参数"""
+
+    format: ExportFormat = ExportFormat.PNG
+    # JPEG/WEBP 质量 0-100，-1 使用 Qt 默认值
+    quality: int = -1
+    # PNG zlib 压缩级别 0-9，0 最快
+    compression: int = 6
+
+
+def encode_image(image: QImage, options: ExportOptions) -> bytes:
+    """按导出参数编码图像"""
+    if options.format is ExportFormat.RAW:
+        header = RAW_HEADER.pack(
+            RAW_MAGIC,
+            image.width(),
+            image.height(),
+            image.bytesPerLine(),
+            int(image.format()),
+        )
+        bits = image.constBits()
+        bits.setsize(image.sizeInBytes())
+        return header + bits.asstring()
+
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    writer = QImageWriter(buffer, options.format.value.encode())
+    if options.format is ExportFormat.PNG:
+        # Qt 的 PNG 写入器通过 quality 映射压缩级别：[0, 100] -> [9, 0]
+        level = min(max(options.compression, 0), 9)
+        writer.setQuality((9 - level) * 91 // 9)
+    elif options.quality >= 0:
+        writer.setQuality(min(options.quality, 100))
+
+    if not writer.write(image):
+        raise RuntimeError(writer.errorString())
+    buffer.close()
+    return bytes(data)
+
+
+class _EncodeTask(QRunnable):
+    """编码任务，结果交给写入线程"""
+
+    def __init__(self, exporter: "ScreenshotExporter", frame, path: str, options: ExportOptions):
+        super().__init__()
+        self._exporter = exporter
+        self._frame = frame
+        self._path = path
+        self._options = options
+
+    def run(self):
+        try:
+            image = self._frame if isinstance(self._frame, QImage) else frame_to_qimage(self._frame)
+            data = encode_image(image, self._options)
+        except Exception as e:
+            self._exporter._finish(self._path, str(e))
+            return
+        finally:
+            self._frame = None
+        self._exporter._writeQueue.put((self._path, data))
+
+
+class ScreenshotExporter(QObject):
+    """后台截图导出器
+
+    submit() 只做入队，编码在线程池中进行，写入线程每次最多合并
+    batchSize 个文件或等待 flushInterval 秒后落盘。排队数量达到
+    maxPending 时 submit() 拒绝新帧（或按需阻塞），避免内存无限增长。
+    """
+
+    # 文件路径
+    exported = pyqtSignal(str)
+    # 文件路径, 错误信息
+    failed = pyqtSignal(str, str)
+    # 本批写入的文件数
+    batchWritten = pyqtSignal(int)
+    # 队列已满时被拒绝的帧
+    dropped = pyqtSignal()
+
+    def __init__(
+        self,
+        maxPending: int = 32,
+        batchSize: int = 8,
+        flushInterval: float = 0.2,
+        maxThreads: int = 0,
+        parent=None,
+    ):
+        super().__init__(parent=parent)
+        self.batchSize = batchSize
+        self.flushInterval = flushInterval
+
+        self._slots = threading.BoundedSemaphore(maxPending)
+        self._pending = 0
+        self._pendingLock = threading.Lock()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._seq = 0
+
+        self._pool = QThreadPool(self)
+        if maxThreads <= 0:
+            # 给 GUI 线程留出一个核心
+            maxThreads = max(1, QThreadPool.globalInstance().maxThreadCount() - 1)
+        self._pool.setMaxThreadCount(maxThreads)
+
+        self._writeQueue: "queue.Queue[Optional[Tuple[str, bytes]]]" = queue.Queue()
+        self._writer = threading.Thread(target=self._writeLoop, name="screenshot-writer", daemon=True)
+        self._writer.start()
+
+    def submit(
+        self,
+        frame,
+        folder: str = "",
+        options: Optional[ExportOptions] = None,
+        block: bool = False,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """提交一帧，返回是否已入队
+
+        frame 为 QImage 或帧缓冲区（见 frame_to_qimage），提交后调用方不应再修改。
+        GUI 线程应使用默认的非阻塞方式，队列满时直接返回 False。
+        """
+        if not self._slots.acquire(block, timeout if block else None):
+            self.dropped.emit()
+            return False
+
+        options = options or ExportOptions()
+        with self._pendingLock:
+            path = self._nextPath(folder or str(SCREENSHOT_DIR), options.format)
+            self._pending += 1
+            self._idle.clear()
+        self._pool.start(_EncodeTask(self, frame, path, options))
+        return True
+
+    def pending(self) -> int:
+        """尚未完成的帧数"""
+        return self._pending
+
+    def waitForDone(self, timeout: Optional[float] = None) -> bool:
+        """等待所有已提交的帧完成，返回是否在超时前完成"""
+        return self._idle.wait(timeout)
+
+    def shutdown(self, timeout: Optional[float] = 5.0):
+        """等待剩余任务完成并停止写入线程"""
+        self.waitForDone(timeout)
+        self._writeQueue.put(None)
+        self._writer.join(timeout)
+
+    def _nextPath(self, folder: str, fmt: ExportFormat) -> str:
+        self._seq += 1
+        return os.path.join(folder, f"{int(time.time() * 1000)}_{self._seq:04d}.{fmt.value}")
+
+    def _writeLoop(self):
+        """写入线程：合并一批编码结果后依次写入"""
+        while True:
+            item = self._writeQueue.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = time.monotonic() + self.flushInterval
+            while len(batch) < self.batchSize:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._writeQueue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._writeBatch(batch)
+                    return
+                batch.append(item)
+            self._writeBatch(batch)
+
+    def _writeBatch(self, batch: List[Tuple[str, bytes]]):
+        written = 0
+        for path, data in batch:
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, "wb") as f:
+                    f.write(data)
+            except OSError as e:
+                self._finish(path, str(e))
+                continue
+            written += 1
+            self._finish(path)
+        if written:
+            self.batchWritten.emit(written)
+
+    def _finish(self, path: str, error: str = ""):
+        """一帧处理结束（成功或失败），释放队列位置"""
+        if error:
+            log.error(f"截图导出失败 path:{path} {error}")
+            self.failed.emit(path, error)
+        else:
+            self.exported.emit(path)
+        self._slots.release()
+        with self._pendingLock:
+            self._pending -= 1
+            if self._pending == 0:
+                self._idle.set()
+
+
+# 全局导出器实例
+_exporter_instance = None
+
+
+def get_exporter() -> ScreenshotExporter:
+    """获取全局截图导出器"""
+    global _exporter_instance
+    if _exporter_instance is None:
+        _exporter_instance = ScreenshotExporter()
+        app = QCoreApplication.instance()
+        if app is not None:
+            # 退出前把已提交的截图写完
+            app.aboutToQuit.connect(_exporter_instance.shutdown)
+    return _exporter_instance
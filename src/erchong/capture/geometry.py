@@ -0,0 +1,202 @@
+"""窗口几何缓存
+
+按 hwnd 缓存客户区在屏幕上的位置与 DPI 缩放，把客户区坐标或归一化坐标
+映射为屏幕像素。缓存由窗口移动/缩放事件失效，而不是每帧重新查询。
+"""
+
+import ctypes
+from ctypes import wintypes
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+import pywintypes
+import win32gui
+
+from ..utils.logger import get_logger
+
+log = get_logger()
+
+# WinEvent 常量
+EVENT_OBJECT_DESTROY = 0x8001
+EVENT_OBJECT_LOCATIONCHANGE = 0x800B
+OBJID_WINDOW = 0
+WINEVENT_OUTOFCONTEXT = 0x0000
+WINEVENT_SKIPOWNPROCESS = 0x0002
+
+# 96 DPI 为 100% 缩放
+BASE_DPI = 96
+
+WinEventProc = ctypes.WINFUNCTYPE(
+    None,
+    wintypes.HANDLE,
+    wintypes.DWORD,
+    wintypes.HWND,
+    wintypes.LONG,
+    wintypes.LONG,
+    wintypes.DWORD,
+    wintypes.DWORD,
+)
+
+# 屏幕矩形 (left, top, right, bottom)
+Rect = Tuple[int, int, int, int]
+
+
+@dataclass(frozen=True)
+class Roi:
+    """客户区内的感兴趣区域
+
+    normalized 为 True 时坐标是相对客户区尺寸的 0-1 比例，
+    否则是 100% 缩放下的客户区像素，按窗口 DPI 换算。
+    """
+
+    x: float
+    y: float
+    width: float
+    height: float
+    normalized: bool = False
+
+
+# 整个客户区
+FULL_CLIENT = Roi(0, 0, 1, 1, normalized=True)
+
+
+@dataclass(frozen=True)
+class WindowGeometry:
+    """客户区几何信息（物理像素）"""
+
+    hwnd: int
+    left: int
+    top: int
+    width: int
+    height: int
+    scale: float
+
+    def mapRoi(self, roi: Roi) -> Rect:
+        """把 ROI 映射为屏幕矩形，并裁剪到客户区内"""
+        if roi.normalized:
+            sx, sy = self.width, self.height
+        else:
+            sx = sy = self.scale
+
+        left = min(max(round(roi.x * sx), 0), self.width)
+        top = min(max(round(roi.y * sy), 0), self.height)
+        right = min(max(round((roi.x + roi.width) * sx), left), self.width)
+        bottom = min(max(round((roi.y + roi.height) * sy), top), self.height)
+        return (self.left + left, self.top + top, self.left + right, self.top + bottom)
+
+
+def query_geometry(hwnd: int) -> Optional[WindowGeometry]:
+    """直接查询窗口客户区几何信息，窗口已关闭时返回 None"""
+    try:
+        _, _, width, height = win32gui.GetClientRect(hwnd)
+        left, top = win32gui.ClientToScreen(hwnd, (0, 0))
+    except pywintypes.error as e:
+        log.warning(f"查询窗口几何信息失败 hwnd:{hwnd:#010x} {e}")
+        return None
+    try:
+        dpi = ctypes.windll.user32.GetDpiForWindow(wintypes.HWND(hwnd)) or BASE_DPI
+    except AttributeError:
+        # Windows 10 1607 之前没有 GetDpiForWindow
+        dpi = BASE_DPI
+    return WindowGeometry(hwnd, left, top, width, height, dpi / BASE_DPI)
+
+
+class WindowGeometryCache:
+    """按 hwnd 缓存的窗口几何信息
+
+    首次访问某个窗口时查询并注册 WinEvent 钩子，之后窗口移动、缩放、
+    切换显示器或销毁时才失效。钩子回调依赖所在线程的消息循环（Qt 事件循环即可）。
+    """
+
+    def __init__(self):
+        self._geometries: Dict[int, WindowGeometry] = {}
+        # hwnd -> 钩子句柄
+        self._hooks: Dict[int, list[int]] = {}
+        self._listeners: list[Callable[[int], None]] = []
+        # 回调对象必须保持引用，否则会被回收
+        self._proc = WinEventProc(self._onWinEvent)
+
+    def get(self, hwnd: int) -> Optional[WindowGeometry]:
+        """获取窗口几何信息，缓存失效时重新查询；窗口已关闭时返回 None"""
+        geometry = self._geometries.get(hwnd)
+        if geometry is None:
+            geometry = query_geometry(hwnd)
+            if geometry is None:
+                return None
+            self._geometries[hwnd] = geometry
+            self._watch(hwnd)
+        return geometry
+
+    def mapRoi(self, hwnd: int, roi: Roi) -> Optional[Rect]:
+        """把窗口的 ROI 映射为屏幕矩形，窗口已关闭时返回 None"""
+        geometry = self.get(hwnd)
+        return geometry.mapRoi(roi) if geometry is not None else None
+
+    def invalidate(self, hwnd: int):
+        """使窗口缓存失效"""
+        if self._geometries.pop(hwnd, None) is not None:
+            for listener in self._listeners:
+                listener(hwnd)
+
+    def forget(self, hwnd: int):
+        """移除窗口缓存和钩子"""
+        self._geometries.pop(hwnd, None)
+        for hook in self._hooks.pop(hwnd, []):
+            ctypes.windll.user32.UnhookWinEvent(wintypes.HANDLE(hook))
+
+    def clear(self):
+        """移除所有缓存和钩子"""
+        for hwnd in list(self._hooks):
+            self.forget(hwnd)
+        self._geometries.clear()
+
+    def addListener(self, listener: Callable[[int], None]):
+        """注册缓存失效回调，参数为 hwnd"""
+        self._listeners.append(listener)
+
+    def _watch(self, hwnd: int):
+        if hwnd in self._hooks:
+            return
+        user32 = ctypes.windll.user32
+        user32.SetWinEventHook.restype = wintypes.HANDLE
+        pid = wintypes.DWORD()
+        user32.GetWindowThreadProcessId(wintypes.HWND(hwnd), ctypes.byref(pid))
+
+        # 只监听目标进程的两种事件，避免接收全桌面的事件
+        hooks = []
+        for event in (EVENT_OBJECT_LOCATIONCHANGE, EVENT_OBJECT_DESTROY):
+            hook = user32.SetWinEventHook(
+                event,
+                event,
+                None,
+                self._proc,
+                pid.value,
+                0,
+                WINEVENT_OUTOFCONTEXT | WINEVENT_SKIPOWNPROCESS,
+            )
+            if hook:
+                hooks.append(hook)
+            else:
+                log.warning(f"注册窗口事件钩子失败 hwnd:{hwnd:#010x}，几何信息不会自动刷新")
+        self._hooks[hwnd] = hooks
+
+    def _onWinEvent(self, hook, event, hwnd, idObject, idChild, thread, time):
+        if idObject != OBJID_WINDOW or not hwnd or hwnd not in self._hooks:
+            return
+        if event == EVENT_OBJECT_LOCATIONCHANGE:
+            self.invalidate(hwnd)
+        elif event == EVENT_OBJECT_DESTROY:
+            self.invalidate(hwnd)
+            self.forget(hwnd)
+
+
+# 全局缓存实例
+_cache_instance = None
+
+
+def get_geometry_cache() -> WindowGeometryCache:
+    """获取全局窗口几何缓存"""
+    global _cache_instance
+    if _cache_instance is None:
+        _cache_instance = WindowGeometryCache()
+    return _cache_instance
@@ -0,0 +1,37 @@
+"""屏幕截图"""
+
+from typing import Iterable, List
+
+import win32gui
+
+import gas.util.screenshot_util as screenshot_util
+
+from .geometry import FULL_CLIENT, Rect, Roi, WindowGeometryCache, get_geometry_cache
+
+
+def capture_rect(rect: Rect):
+    """截取屏幕矩形 (left, top, right, bottom)，返回帧缓冲区"""
+    return screenshot_util.screenshot_bitblt(win32gui.GetDesktopWindow(), rect)
+
+
+def capture_rois(
+    hwnd: int,
+    rois: Iterable[Roi] = (FULL_CLIENT,),
+    cache: WindowGeometryCache | None = None,
+) -> List:
+    """按窗口客户区的 ROI 截图，每个 ROI 返回一帧
+
+    只截取请求的区域，空区域（窗口最小化、已关闭或 ROI 在客户区外）返回 None。
+    """
+    rois = tuple(rois)
+    geometry = (cache or get_geometry_cache()).get(hwnd)
+    if geometry is None:
+        return [None] * len(rois)
+    frames = []
+    for roi in rois:
+        rect = geometry.mapRoi(roi)
+        if rect[2] <= rect[0] or rect[3] <= rect[1]:
+            frames.append(None)
+            continue
+        frames.append(capture_rect(rect))
+    return frames
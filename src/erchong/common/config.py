@@ -3,6 +3,8 @@ from enum import Enum
 import qfluentwidgets as qf
 import PyQt5.QtCore as qc
 from src.erchong.config.settings import QT_QSS_DIR, RESOURCE_DIR
+from src.erchong.capture.exporter import ExportFormat, ExportOptions
+from src.erchong.common.config_persister import ConfigPersister
 
 class Language(Enum):
     """ Language enumeration """
@@ -34,7 +36,26 @@ class Config(qf.QConfig):
         "MainWindow", "DpiScale", "Auto", qf.OptionsValidator([1, 1.25, 1.5, 1.75, 2, "Auto"]), restart=True)
     language = qf.OptionsConfigItem(
         "MainWindow", "Language", Language.AUTO, qf.OptionsValidator(Language), LanguageSerializer(), restart=True)
+
+    # screenshot
+    saveScreenshot = qf.ConfigItem(
+        "Screenshot", "SaveScreenshot", False, qf.BoolValidator())
+    # 为空时使用默认的 SCREENSHOT_DIR，目录在首次保存时由导出器创建
+    screenshotFolder = qf.ConfigItem("Screenshot", "Folder", "")
+    screenshotFormat = qf.OptionsConfigItem(
+        "Screenshot", "Format", ExportFormat.PNG, qf.OptionsValidator(ExportFormat), qf.EnumSerializer(ExportFormat))
+    screenshotQuality = qf.RangeConfigItem(
+        "Screenshot", "Quality", 90, qf.RangeValidator(0, 100))
+    screenshotCompression = qf.RangeConfigItem(
+        "Screenshot", "Compression", 1, qf.RangeValidator(0, 9))
     
+    def getExportOptions(self) -> ExportOptions:
+        return ExportOptions(
+            self.get(self.screenshotFormat),
+            self.get(self.screenshotQuality),
+            self.get(self.screenshotCompression),
+        )
+
     def getQssFile(self,fileName:str) -> str:
         filePath = ""
         if qf.isDarkTheme():
@@ -49,4 +70,8 @@ class Config(qf.QConfig):
 
 
 cfg = Config()
-qf.qconfig.load(str(RESOURCE_DIR/"qt/config.json"), cfg)
\ No newline at end of file
+qf.qconfig.load(str(RESOURCE_DIR/"qt/config.json"), cfg)
+
+# set() 不再同步写文件，由 persister 合并后在后台写入
+persister = ConfigPersister(cfg)
+persister.install(cfg, qf.qconfig)
\ No newline at end of file
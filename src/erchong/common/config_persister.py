@@ -0,0 +1,198 @@
+"""配置持久化
+
+qfluentwidgets 每次 set() 都会同步重写整个 JSON 文件。这里接管 save()：
+修改只标记为脏，防抖后在 GUI 线程生成快照，由工作线程原子写入。
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import qfluentwidgets as qf
+from PyQt5.QtCore import QCoreApplication, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+
+from src.erchong.utils.logger import get_logger
+
+log = get_logger()
+
+
+class _WriteTask(QRunnable):
+    """原子写入：先写临时文件再替换，避免中途退出留下半个 JSON"""
+
+    def __init__(self, persister: "ConfigPersister", path: Path, text: str):
+        super().__init__()
+        self._persister = persister
+        self._path = path
+        self._text = text
+
+    def run(self):
+        tmp = self._path.with_name(self._path.name + ".tmp")
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(self._text)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self._path)
+            self._persister._onWritten(self._path, os.stat(self._path).st_mtime_ns)
+        except OSError as e:
+            log.error(f"配置保存失败 path:{self._path} {e}")
+            self._persister._onWritten(self._path, None)
+            self._persister.saveFailed.emit(str(e))
+
+
+class ConfigPersister(QObject):
+    """合并、防抖的配置写入器"""
+
+    # 配置文件路径
+    saved = pyqtSignal(str)
+    # 错误信息
+    saveFailed = pyqtSignal(str)
+
+    def __init__(self, config: qf.QConfig, delay: int = 500, maxDelay: int = 3000, parent=None):
+        """
+        delay: 最后一次修改后等待的毫秒数
+        maxDelay: 持续修改（如拖动滑块）时最长的写入间隔
+        """
+        super().__init__(parent=parent)
+        self._config = config
+        self._delay = delay
+        self._maxDelay = maxDelay
+        self._timer: Optional[QTimer] = None
+        self._dirtySince = 0.0
+        # 上次写入/读取的内容与文件时间，用于跳过无变化的写入和重载
+        self._lastText: Optional[str] = None
+        self._mtime: Optional[int] = None
+        self._writing = 0
+        self._writingLock = threading.Lock()
+
+        # 单线程池保证写入顺序
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+
+    @property
+    def file(self) -> Path:
+        return Path(self._config.file)
+
+    def install(self, *configs: qf.QConfig):
+        """接管 save()，之后 set() 只安排一次延迟写入"""
+        for config in configs or (self._config,):
+            config.save = self.schedule
+
+    def schedule(self):
+        """标记配置已修改，防抖后写入"""
+        app = QCoreApplication.instance()
+        if app is None:
+            # 没有事件循环，无法防抖
+            self.flush(wait=True)
+            return
+
+        if self._timer is None:
+            self._timer = QTimer(self)
+            self._timer.setSingleShot(True)
+            self._timer.timeout.connect(self.flush)
+            app.aboutToQuit.connect(lambda: self.flush(wait=True))
+
+        now = time.monotonic()
+        if not self._dirtySince:
+            self._dirtySince = now
+        remaining = self._maxDelay - (now - self._dirtySince) * 1000
+        self._timer.start(int(max(0, min(self._delay, remaining))))
+
+    def flush(self, wait: bool = False):
+        """立即写入挂起的修改"""
+        if self._timer is not None:
+            self._timer.stop()
+        self._dirtySince = 0.0
+
+        text = json.dumps(self._config.toDict(), ensure_ascii=False, indent=4)
+        if text == self._lastText:
+            return
+        self._lastText = text
+        with self._writingLock:
+            self._writing += 1
+        self._pool.start(_WriteTask(self, self.file, text))
+        if wait:
+            self._pool.waitForDone()
+
+    def reload(self, keys: Optional[Iterable[str]] = None) -> List[str]:
+        """从文件增量重载，返回发生变化的配置键
+
+        文件未变化时只做一次 stat。keys 为 "Group.Name" 形式，
+        为 None 时重载全部；值经配置项的校验器修正，无法解析的值被忽略。
+        """
+        if self._dirtySince or self._writing:
+            # 本地还有未落盘的修改，以内存为准
+            return []
+        try:
+            mtime = os.stat(self.file).st_mtime_ns
+        except OSError:
+            return []
+        if mtime == self._mtime:
+            return []
+
+        try:
+            with open(self.file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            log.warning(f"配置重载失败 path:{self.file} {e}")
+            return []
+        self._mtime = mtime
+
+        wanted = set(keys) if keys is not None else None
+        items = self._items()
+        changed = []
+        for key, value in self._flatten(data).items():
+            item = items.get(key)
+            if item is None or (wanted is not None and key not in wanted):
+                continue
+            if item.serialize() == value:
+                continue
+            oldValue = item.value
+            try:
+                newValue = item.serializer.deserialize(value)
+                # 默认序列化器不做检查，类型错误的值在 set() 的校验器修正中才会抛出异常
+                # 走 set() 以触发主题等信号，save=False 避免回写
+                self._config.set(item, newValue, save=False)
+            except Exception as e:
+                log.warning(f"忽略无效配置 {key}={value!r} {e}")
+                continue
+            if item.value != oldValue:
+                changed.append(key)
+
+        # 内存与文件可能已不一致，下次 flush 不再跳过
+        self._lastText = None
+        return changed
+
+    def _items(self) -> Dict[str, qf.ConfigItem]:
+        items = {}
+        for name in dir(self._config.__class__):
+            item = getattr(self._config.__class__, name)
+            if isinstance(item, qf.ConfigItem):
+                items[item.key] = item
+        return items
+
+    @staticmethod
+    def _flatten(data: dict) -> Dict[str, object]:
+        flat = {}
+        for group, value in data.items():
+            if isinstance(value, dict):
+                for name, v in value.items():
+                    flat[f"{group}.{name}"] = v
+            else:
+                flat[group] = value
+        return flat
+
+    def _onWritten(self, path: Path, mtime: Optional[int]):
+        with self._writingLock:
+            self._writing -= 1
+        if mtime is None:
+            # 写入失败，下次 flush 不能因内容未变而跳过
+            self._lastText = None
+            return
+        # 自己写入的文件不需要重载
+        self._mtime = mtime
+        self.saved.emit(str(path))
@@ -0,0 +1,142 @@
+"""活动调节器
+
+根据主窗口是否可见、应用是否在前台，统一暂停或放慢非必要的定时器、
+动画和界面刷新，使程序在最小化/托盘时接近空闲。
+
+脚本关键的定时器（如按配置频率运行的截图循环）不要注册到这里，
+它们的频率不受窗口状态影响。
+"""
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING, Dict, Optional
+
+from PyQt5.QtCore import QCoreApplication, QEvent, QObject, Qt, QTimer, pyqtSignal
+from PyQt5.QtGui import QGuiApplication
+
+if TYPE_CHECKING:
+    from PyQt5.QtWidgets import QWidget
+
+from src.erchong.utils.logger import get_logger
+
+log = get_logger()
+
+
+class ActivityState(Enum):
+    """应用活动状态"""
+
+    # 窗口可见且应用在前台
+    ACTIVE = "active"
+    # 窗口可见但应用不在前台
+    BACKGROUND = "background"
+    # 窗口最小化或隐藏到托盘
+    HIDDEN = "hidden"
+
+
+@dataclass
+class _TimerEntry:
+    timer: QTimer
+    # 前台间隔
+    interval: int
+    # 后台间隔，None 表示后台保持原频率
+    backgroundInterval: Optional[int]
+    # 被调节器暂停前是否在运行
+    paused: bool = False
+
+
+class ActivityGovernor(QObject):
+    """活动调节器"""
+
+    stateChanged = pyqtSignal(object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self._state = ActivityState.ACTIVE
+        self._window: Optional["QWidget"] = None
+        self._timers: Dict[int, _TimerEntry] = {}
+
+    @property
+    def state(self) -> ActivityState:
+        return self._state
+
+    def isHidden(self) -> bool:
+        return self._state is ActivityState.HIDDEN
+
+    def watch(self, window: "QWidget"):
+        """跟踪主窗口的显示状态"""
+        if self._window is not None:
+            self._window.removeEventFilter(self)
+        self._window = window
+        window.installEventFilter(self)
+
+        app = QCoreApplication.instance()
+        if isinstance(app, QGuiApplication):
+            app.applicationStateChanged.connect(self._updateState)
+        self._updateState()
+
+    def registerTimer(self, timer: QTimer, backgroundInterval: Optional[int] = None):
+        """注册非必要定时器
+
+        窗口隐藏时暂停，恢复显示后按原间隔继续；应用在后台时
+        如果给出 backgroundInterval 则改用该间隔。
+        """
+        key = id(timer)
+        self._timers[key] = _TimerEntry(timer, timer.interval(), backgroundInterval)
+        timer.destroyed.connect(lambda: self._timers.pop(key, None))
+        self._applyTimer(self._timers[key])
+
+    def unregisterTimer(self, timer: QTimer):
+        """取消注册并恢复原间隔"""
+        entry = self._timers.pop(id(timer), None)
+        if entry is None:
+            return
+        timer.setInterval(entry.interval)
+        if entry.paused:
+            timer.start()
+
+    def eventFilter(self, obj, e):
+        if obj is self._window and e.type() in (
+            QEvent.Type.Show,
+            QEvent.Type.Hide,
+            QEvent.Type.WindowStateChange,
+        ):
+            self._updateState()
+        return super().eventFilter(obj, e)
+
+    def _updateState(self, *_):
+        window = self._window
+        app = QCoreApplication.instance()
+        if window is None or not window.isVisible() or window.isMinimized():
+            state = ActivityState.HIDDEN
+        elif isinstance(app, QGuiApplication) and app.applicationState() != Qt.ApplicationState.ApplicationActive:
+            state = ActivityState.BACKGROUND
+        else:
+            state = ActivityState.ACTIVE
+
+        if state is self._state:
+            return
+        log.debug(f"活动状态 {self._state.value} -> {state.value}")
+        self._state = state
+        for entry in self._timers.values():
+            self._applyTimer(entry)
+        self.stateChanged.emit(state)
+
+    def _applyTimer(self, entry: _TimerEntry):
+        timer = entry.timer
+        if self._state is ActivityState.HIDDEN:
+            if timer.isActive():
+                entry.paused = True
+                timer.stop()
+            return
+
+        if self._state is ActivityState.BACKGROUND and entry.backgroundInterval is not None:
+            timer.setInterval(entry.backgroundInterval)
+        else:
+            timer.setInterval(entry.interval)
+        if entry.paused:
+            entry.paused = False
+            timer.start()
+
+
+# 全局活动调节器
+governor = ActivityGovernor()
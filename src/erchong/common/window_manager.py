@@ -0,0 +1,137 @@
+"""工具窗口生命周期管理
+
+每种工具窗口同时只保留一个实例，重复打开时激活已有窗口。关闭后窗口
+释放资源，按暖池大小决定保留隐藏实例以便快速重开，还是直接销毁。
+
+窗口可以实现以下方法参与管理：
+- releaseResources(): 关闭时调用，断开信号、释放图片等
+- restoreResources(): 从暖池复用时调用，恢复 releaseResources() 释放的内容
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Type, TypeVar
+
+from PyQt5.QtCore import QEvent, QObject, QTimer
+from PyQt5.QtGui import QImage
+from PyQt5.QtWidgets import QLabel, QWidget
+
+from src.erchong.utils.logger import get_logger
+
+log = get_logger()
+
+W = TypeVar("W", bound=QWidget)
+
+
+@dataclass
+class WindowStats:
+    """某类窗口的统计信息"""
+
+    live: int
+    pooled: int
+    # 图片、位图占用的估算字节数
+    memory: int
+
+
+def estimate_memory(widget: QWidget) -> int:
+    """估算窗口中图片和位图占用的内存"""
+    total = 0
+    for label in widget.findChildren(QLabel):
+        # qfluentwidgets 的 ImageLabel 把原图保存在 image 属性中
+        image = getattr(label, "image", None)
+        if isinstance(image, QImage) and not image.isNull():
+            total += image.sizeInBytes()
+        pixmap = label.pixmap()
+        if pixmap is not None and not pixmap.isNull():
+            total += pixmap.width() * pixmap.height() * pixmap.depth() // 8
+    return total
+
+
+class WindowManager(QObject):
+    """工具窗口管理器"""
+
+    def __init__(self, poolSize: int = 1, parent=None):
+        """poolSize: 每种窗口关闭后保留的隐藏实例数，0 表示关闭即销毁"""
+        super().__init__(parent=parent)
+        self.poolSize = poolSize
+        self._live: Dict[type, QWidget] = {}
+        self._pool: Dict[type, List[QWidget]] = {}
+
+    def open(self, cls: Type[W], factory: Optional[Callable[[], W]] = None) -> W:
+        """打开某类窗口：已打开则激活，暖池中有则复用，否则新建"""
+        widget = self._live.get(cls)
+        if widget is None:
+            pool = self._pool.get(cls)
+            if pool:
+                widget = pool.pop()
+                self._call(widget, "restoreResources")
+            else:
+                widget = factory() if factory else cls()
+                widget.installEventFilter(self)
+            self._live[cls] = widget
+            log.debug(f"打开窗口 {cls.__name__} {self._format(cls)}")
+
+        widget.show()
+        widget.raise_()
+        widget.activateWindow()
+        return widget  # type: ignore[return-value]
+
+    def stats(self) -> Dict[str, WindowStats]:
+        """按窗口类型统计实例数和内存"""
+        result = {}
+        for cls in set(self._live) | set(self._pool):
+            widgets = self._pool.get(cls, [])[:]
+            if cls in self._live:
+                widgets.append(self._live[cls])
+            result[cls.__name__] = WindowStats(
+                live=1 if cls in self._live else 0,
+                pooled=len(self._pool.get(cls, [])),
+                memory=sum(estimate_memory(w) for w in widgets),
+            )
+        return result
+
+    def clear(self):
+        """销毁暖池中的所有窗口"""
+        for pool in self._pool.values():
+            for widget in pool:
+                self._destroy(widget)
+        self._pool.clear()
+
+    def eventFilter(self, obj, e):
+        if e.type() == QEvent.Type.Close and obj in self._live.values():
+            # 关闭事件可能被窗口拒绝，等处理完后再确认
+            QTimer.singleShot(0, lambda w=obj: self._onClosed(w))
+        return super().eventFilter(obj, e)
+
+    def _onClosed(self, widget: QWidget):
+        cls = type(widget)
+        if widget.isVisible() or self._live.get(cls) is not widget:
+            return
+        del self._live[cls]
+
+        self._call(widget, "releaseResources")
+        pool = self._pool.setdefault(cls, [])
+        if len(pool) < self.poolSize:
+            pool.append(widget)
+        else:
+            self._destroy(widget)
+        log.debug(f"关闭窗口 {cls.__name__} {self._format(cls)}")
+
+    def _destroy(self, widget: QWidget):
+        widget.removeEventFilter(self)
+        widget.deleteLater()
+
+    def _format(self, cls: type) -> str:
+        stats = self.stats().get(cls.__name__)
+        if stats is None:
+            return "live:0 pooled:0"
+        return f"live:{stats.live} pooled:{stats.pooled} memory:{stats.memory / 1024:.0f}KiB"
+
+    @staticmethod
+    def _call(widget: QWidget, name: str):
+        method = getattr(widget, name, None)
+        if method is not None:
+            method()
+
+
+# 全局窗口管理器
+windowManager = WindowManager()
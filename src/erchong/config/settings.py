@@ -11,6 +11,9 @@ RESOURCE_DIR = PROJECT_ROOT / "resource"
 # 日志目录
 LOG_DIR = PROJECT_ROOT / "logs"
 
+# 截图保存目录
+SCREENSHOT_DIR = PROJECT_ROOT / "screenshots"
+
 # 日志配置文件
 LOG_CONFIG_FILE = PROJECT_ROOT / "logging_config.json"
 
@@ -0,0 +1,104 @@
+"""无界面守护进程入口
+
+只启动日志和任务运行器（可选本地控制服务），运行在 QCoreApplication 上，
+不加载配置和窗口部件。脚本通过 ctx 获得任务名、日志器和停止控制，
+截图等功能由脚本自行导入（截图仅支持 Windows）。用法：
+
+    erchong-daemon script1.py script2.py
+    erchong-daemon --ipc erchong script1.py   # 同时启动本地控制服务
+"""
+
+import argparse
+import signal
+import sys
+import time
+
+from PyQt5.QtCore import QCoreApplication, QTimer
+
+from .ipc import ControlServer
+from .tasks import TaskRunner
+from .utils.logger import get_logger
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="erchong-daemon", description="无界面运行脚本")
+    parser.add_argument("scripts", nargs="*", help="要运行的脚本文件，需定义 run(ctx)")
+    parser.add_argument(
+        "--ipc",
+        metavar="NAME",
+        default="",
+        help="启动本地控制服务（Linux 为 Unix 套接字，Windows 为命名管道）",
+    )
+    parser.add_argument(
+        "--keep-alive",
+        action="store_true",
+        help="所有脚本结束后继续运行（等待外部控制）",
+    )
+    return parser.parse_args(argv)
+
+
+def create_core_app(argv) -> QCoreApplication:
+    """创建无界面应用"""
+    app = QCoreApplication(argv)
+
+    # Ctrl+C 退出：Qt 事件循环中 Python 信号处理函数只有在解释器获得控制权时才会执行
+    signal.signal(signal.SIGINT, lambda *_: app.quit())
+    timer = QTimer(app)
+    timer.timeout.connect(lambda: None)
+    timer.start(200)
+
+    return app
+
+
+def capture_frame(hwnd: int, normalized: bool, x: float, y: float, width: float, height: float):
+    """控制服务的截图函数：hwnd 为 0 时截取屏幕矩形，否则截取窗口客户区 ROI"""
+    # 截图依赖 Win32 API，延迟导入，其他平台上控制服务仍可启动
+    from .capture.geometry import Roi
+    from .capture.screen import capture_rect, capture_rois
+
+    if hwnd:
+        return capture_rois(hwnd, (Roi(x, y, width, height, normalized),))[0]
+    return capture_rect((int(x), int(y), int(x + width), int(y + height)))
+
+
+def main():
+    """守护进程主函数"""
+    startTime = time.perf_counter()
+    args = parse_args(sys.argv[1:])
+    app = create_core_app(sys.argv[:1])
+    log = get_logger()
+
+    runner = TaskRunner(app)
+    app.aboutToQuit.connect(runner.stopAll)
+    app.aboutToQuit.connect(lambda: runner.join(5))
+    if not args.keep_alive and not args.ipc:
+        runner.allFinished.connect(app.quit)
+
+    if args.ipc:
+        # 非 Windows 平台没有截图实现，截图请求返回 UNSUPPORTED
+        capture = capture_frame if sys.platform == "win32" else None
+        server = ControlServer(args.ipc, runner, capture, parent=app)
+        if not server.start():
+            sys.exit(1)
+        app.aboutToQuit.connect(server.close)
+
+    names = []
+    for path in args.scripts:
+        try:
+            names.append(runner.load(path))
+        except Exception as e:
+            log.error(f"脚本加载失败 path:{path} {e}")
+
+    if not names and not args.keep_alive and not args.ipc:
+        log.error("没有可运行的脚本")
+        sys.exit(1)
+
+    log.info(f"守护进程已启动 耗时:{(time.perf_counter() - startTime) * 1000:.0f}ms")
+    for name in names:
+        runner.start(name)
+
+    sys.exit(app.exec_())
+
+
+if __name__ == "__main__":
+    main()
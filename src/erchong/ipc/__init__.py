@@ -0,0 +1,7 @@
+"""本地控制接口"""
+
+from .client import ControlClient, ControlError, Frame
+from .protocol import Op, Status
+from .server import ControlServer
+
+__all__ = ["ControlClient", "ControlError", "Frame", "Op", "Status", "ControlServer"]
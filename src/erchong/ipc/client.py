@@ -0,0 +1,175 @@
+"""本地控制客户端
+
+同步阻塞调用，供外部工具和测试脚本使用，不需要事件循环。
+"""
+
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+
+from PyQt5.QtNetwork import QLocalSocket
+
+from . import protocol
+from .protocol import Message, Op, Status
+
+MAX_PENDING_PUSHES = 64
+
+
+class ControlError(Exception):
+    """服务端返回错误"""
+
+    def __init__(self, op: Op | int, status: Status | int, message: str = ""):
+        super().__init__(
+            f"{protocol.name_of(op)} 失败 status:{protocol.name_of(status)} {message}".strip()
+        )
+        self.op = op
+        self.status = status
+
+
+@dataclass
+class Frame:
+    """共享内存中的一帧，data 在下一次截图前有效"""
+
+    sequence: int
+    width: int
+    height: int
+    stride: int
+    channels: int
+    data: memoryview
+
+
+class ControlClient:
+    """本地控制客户端"""
+
+    def __init__(self, name: str, timeout: int = 5000):
+        """timeout: 单次调用的超时毫秒数"""
+        self.name = name
+        self.timeout = timeout
+        self._socket = QLocalSocket()
+        self._reader = protocol.MessageReader()
+        self._pending: List[Message] = []
+        self._requestId = 0
+        self._shm: Optional[shared_memory.SharedMemory] = None
+
+    def connect(self):
+        self._socket.connectToServer(self.name)
+        if not self._socket.waitForConnected(self.timeout):
+            raise ConnectionError(f"无法连接控制服务 name:{self.name} {self._socket.errorString()}")
+
+    def close(self):
+        self._closeShm()
+        self._socket.disconnectFromServer()
+
+    def __enter__(self):
+        self.connect()
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def ping(self, payload: bytes = b"") -> bytes:
+        return self.call(Op.PING, payload)
+
+    def capture(
+        self,
+        hwnd: int,
+        x: float,
+        y: float,
+        width: float,
+        height: float,
+        normalized: bool = False,
+    ) -> Frame:
+        """截图，hwnd 为 0 时 (x, y, width, height) 为屏幕矩形"""
+        payload = protocol.CAPTURE_REQUEST.pack(hwnd, normalized, x, y, width, height)
+        return self._frame(self.call(Op.CAPTURE, payload))
+
+    def match(
+        self,
+        hwnd: int,
+        x: float,
+        y: float,
+        width: float,
+        height: float,
+        args: str,
+        normalized: bool = False,
+    ) -> List[Tuple[int, int, float]]:
+        """在截图区域中匹配，args 由服务端的匹配函数解释"""
+        payload = protocol.CAPTURE_REQUEST.pack(hwnd, normalized, x, y, width, height)
+        reply = self.call(Op.MATCH, payload + protocol.pack_str(args))
+        (count,) = protocol.U32.unpack_from(reply)
+        size = protocol.MATCH_RESULT.size
+        return [
+            protocol.MATCH_RESULT.unpack_from(reply, protocol.U32.size + i * size)
+            for i in range(count)
+        ]
+
+    def tasks(self) -> Tuple[List[str], List[str]]:
+        """返回 (已加载任务, 正在运行任务)"""
+        reply = self.call(Op.TASK_LIST)
+        loaded, offset = protocol.unpack_str_list(reply)
+        running, _ = protocol.unpack_str_list(reply, offset)
+        return loaded, running
+
+    def startTask(self, name: str):
+        self.call(Op.TASK_START, protocol.pack_str(name))
+
+    def stopTask(self, name: str):
+        self.call(Op.TASK_STOP, protocol.pack_str(name))
+
+    def subscribeMetrics(self, interval: int) -> Dict[str, float]:
+        """订阅指标推送，interval 为 0 时取消；返回当前指标"""
+        return protocol.unpack_metrics(self.call(Op.SUBSCRIBE_METRICS, protocol.SUBSCRIBE.pack(interval)))
+
+    def readMetrics(self, timeout: Optional[int] = None) -> Dict[str, float]:
+        """等待下一条指标推送"""
+        message = self._receive(lambda m: m.op == Op.METRICS, timeout)
+        return protocol.unpack_metrics(message.payload)
+
+    def call(self, op: Op | int, payload: bytes = b"") -> bytes:
+        """发送请求并等待响应负载"""
+        self._requestId = (self._requestId + 1) & 0xFFFFFFFF
+        requestId = self._requestId
+        self._socket.write(protocol.pack(op, requestId, payload))
+        self._socket.flush()
+
+        reply = self._receive(lambda m: m.op == op and m.requestId == requestId)
+        if reply.status != Status.OK:
+            message = ""
+            if reply.status == Status.ERROR and reply.payload:
+                message, _ = protocol.unpack_str(reply.payload)
+            raise ControlError(op, reply.status, message)
+        return reply.payload
+
+    def _receive(self, match, timeout: Optional[int] = None) -> Message:
+        timeout = self.timeout if timeout is None else timeout
+        while True:
+            for i, message in enumerate(self._pending):
+                if match(message):
+                    return self._pending.pop(i)
+            if not self._socket.waitForReadyRead(timeout):
+                raise TimeoutError(f"等待响应超时 {self._socket.errorString()}")
+            self._pending.extend(self._reader.feed(bytes(self._socket.readAll())))
+            # 没有读取的指标推送只保留最近的若干条
+            pushes = [m for m in self._pending if m.op == Op.METRICS]
+            for stale in pushes[:-MAX_PENDING_PUSHES]:
+                self._pending.remove(stale)
+
+    def _frame(self, reply: bytes) -> Frame:
+        sequence, offset, width, height, stride, channels = protocol.FRAME_INFO.unpack_from(reply)
+        name, _ = protocol.unpack_str(reply, protocol.FRAME_INFO.size)
+        if self._shm is None or self._shm.name != name:
+            self._closeShm()
+            # 共享内存由服务端管理，客户端不登记到 resource_tracker
+            self._shm = shared_memory.SharedMemory(name, track=False)
+        size = stride * height
+        return Frame(sequence, width, height, stride, channels, self._shm.buf[offset:offset + size])
+
+    def _closeShm(self):
+        if self._shm is None:
+            return
+        try:
+            self._shm.close()
+        except BufferError:
+            # 调用方仍持有旧帧的 data，映射随其回收释放
+            pass
+        self._shm = None
@@ -0,0 +1,158 @@
+"""控制协议
+
+每条消息由 12 字节头和负载组成：
+    magic(u16) opcode(u8) status(u8) request_id(u32) length(u32)
+所有整数为小端序，字符串为 u16 长度前缀的 UTF-8。
+帧数据不经过套接字，只传共享内存中的描述信息。
+"""
+
+import struct
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Iterator, List, Tuple
+
+MAGIC = 0xEC02
+HEADER = struct.Struct("<HBBII")
+
+# 单条消息负载上限，防止错误数据导致无限缓冲
+MAX_PAYLOAD = 1 << 20
+
+# 截图请求：hwnd, 是否归一化, x, y, width, height
+# hwnd 为 0 时 x, y, width, height 为屏幕像素矩形
+CAPTURE_REQUEST = struct.Struct("<QB4f")
+# 帧描述：序号, 偏移, 宽, 高, 每行字节数, 通道数（后接共享内存名字符串）
+FRAME_INFO = struct.Struct("<IIIIII")
+# 匹配结果：x, y, 分数
+MATCH_RESULT = struct.Struct("<iif")
+# 指标订阅：间隔毫秒，0 表示取消
+SUBSCRIBE = struct.Struct("<I")
+
+# 计数等通用无符号整数
+U32 = struct.Struct("<I")
+_U16 = struct.Struct("<H")
+_F64 = struct.Struct("<d")
+
+
+class Op(IntEnum):
+    """操作码"""
+
+    PING = 1
+    CAPTURE = 2
+    MATCH = 3
+    TASK_LIST = 4
+    TASK_START = 5
+    TASK_STOP = 6
+    SUBSCRIBE_METRICS = 7
+    # 服务端推送
+    METRICS = 8
+
+
+class Status(IntEnum):
+    """响应状态"""
+
+    OK = 0
+    ERROR = 1
+    UNSUPPORTED = 2
+
+
+class ProtocolError(Exception):
+    """协议数据错误"""
+
+
+@dataclass(frozen=True)
+class Message:
+    # 未知的操作码和状态保留为原始整数，由接收方决定如何响应
+    op: Op | int
+    status: Status | int
+    requestId: int
+    payload: bytes
+
+
+def pack(op: int, requestId: int, payload: bytes = b"", status: int = Status.OK) -> bytes:
+    """打包一条消息"""
+    return HEADER.pack(MAGIC, op, status, requestId, len(payload)) + payload
+
+
+class MessageReader:
+    """增量解析字节流中的消息"""
+
+    def __init__(self):
+        self._buffer = bytearray()
+
+    def feed(self, data: bytes) -> Iterator[Message]:
+        """追加数据并返回其中完整的消息
+
+        只有消息头无效（magic 错误或长度超限）时抛出 ProtocolError，
+        之后的数据无法再对齐消息边界。
+        """
+        self._buffer += data
+        while len(self._buffer) >= HEADER.size:
+            magic, op, status, requestId, length = HEADER.unpack_from(self._buffer)
+            if magic != MAGIC or length > MAX_PAYLOAD:
+                self._buffer.clear()
+                raise ProtocolError(f"无效的消息头 magic:{magic:#06x} length:{length}")
+            end = HEADER.size + length
+            if len(self._buffer) < end:
+                return
+            payload = bytes(self._buffer[HEADER.size:end])
+            del self._buffer[:end]
+            yield Message(_enum(Op, op), _enum(Status, status), requestId, payload)
+
+
+def name_of(value: int) -> str:
+    """枚举名，未知值为数字"""
+    return getattr(value, "name", str(value))
+
+
+def _enum(cls, value: int):
+    """转换为枚举，未知值保留原始整数"""
+    try:
+        return cls(value)
+    except ValueError:
+        return value
+
+
+def pack_str(text: str) -> bytes:
+    data = text.encode("utf-8")
+    return _U16.pack(len(data)) + data
+
+
+def unpack_str(buffer: bytes, offset: int = 0) -> Tuple[str, int]:
+    """读取字符串，返回 (字符串, 新偏移)"""
+    (length,) = _U16.unpack_from(buffer, offset)
+    offset += _U16.size
+    return buffer[offset:offset + length].decode("utf-8"), offset + length
+
+
+def pack_str_list(items: List[str]) -> bytes:
+    return U32.pack(len(items)) + b"".join(pack_str(item) for item in items)
+
+
+def unpack_str_list(buffer: bytes, offset: int = 0) -> Tuple[List[str], int]:
+    (count,) = U32.unpack_from(buffer, offset)
+    offset += U32.size
+    items = []
+    for _ in range(count):
+        item, offset = unpack_str(buffer, offset)
+        items.append(item)
+    return items, offset
+
+
+def pack_metrics(metrics: dict) -> bytes:
+    """指标：数量(u32) + 若干 (名称, f64)"""
+    parts = [U32.pack(len(metrics))]
+    for name, value in metrics.items():
+        parts.append(pack_str(name))
+        parts.append(_F64.pack(float(value)))
+    return b"".join(parts)
+
+
+def unpack_metrics(buffer: bytes) -> dict:
+    (count,) = U32.unpack_from(buffer, 0)
+    offset = U32.size
+    metrics = {}
+    for _ in range(count):
+        name, offset = unpack_str(buffer, offset)
+        (metrics[name],) = _F64.unpack_from(buffer, offset)
+        offset += _F64.size
+    return metrics
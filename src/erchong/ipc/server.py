@@ -0,0 +1,255 @@
+"""本地控制服务
+
+基于 QLocalServer（Linux 上为 Unix 套接字，Windows 上为命名管道），
+在事件循环线程中处理请求。截图结果写入共享内存，套接字只返回描述信息。
+"""
+
+import time
+from multiprocessing import shared_memory
+from typing import Callable, Dict, List, Optional, Tuple
+
+from PyQt5.QtCore import QObject, QTimer
+from PyQt5.QtNetwork import QLocalServer, QLocalSocket
+
+from ..tasks import TaskRunner
+from ..utils.logger import get_logger
+from . import protocol
+from .protocol import Message, Op, Status
+
+log = get_logger()
+
+# 截图函数：(hwnd, normalized, x, y, width, height) -> 帧缓冲区或 None
+CaptureFunc = Callable[[int, bool, float, float, float, float], object]
+# 匹配函数：(帧缓冲区, 参数) -> [(x, y, 分数)]
+MatchFunc = Callable[[object, str], List[Tuple[int, int, float]]]
+
+
+class FrameBuffer:
+    """保存最近一帧的共享内存，容量不足时按新名称重建"""
+
+    def __init__(self, prefix: str):
+        self._prefix = prefix
+        self._generation = 0
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        self.sequence = 0
+
+    def write(self, frame) -> bytes:
+        """写入一帧，返回 FRAME_INFO + 共享内存名"""
+        view = memoryview(frame)
+        if view.ndim == 2:
+            height, width = view.shape
+            channels = 1
+        else:
+            height, width, channels = view.shape
+        if not view.c_contiguous:
+            view = memoryview(view.tobytes())
+        data = view.cast("B")
+
+        if self._shm is None or self._shm.size < data.nbytes:
+            self.close()
+            self._generation += 1
+            self._shm = self._create(f"{self._prefix}_{self._generation}", data.nbytes)
+        self._shm.buf[:data.nbytes] = data
+        self.sequence += 1
+
+        info = protocol.FRAME_INFO.pack(self.sequence, 0, width, height, width * channels, channels)
+        return info + protocol.pack_str(self._shm.name)
+
+    @staticmethod
+    def _create(name: str, size: int) -> shared_memory.SharedMemory:
+        try:
+            return shared_memory.SharedMemory(name, create=True, size=size)
+        except FileExistsError:
+            # 上次异常退出残留的同名共享内存
+            stale = shared_memory.SharedMemory(name)
+            stale.close()
+            stale.unlink()
+            return shared_memory.SharedMemory(name, create=True, size=size)
+
+    def close(self):
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+
+class ControlServer(QObject):
+    """本地控制服务"""
+
+    def __init__(
+        self,
+        name: str,
+        runner: Optional[TaskRunner] = None,
+        capture: Optional[CaptureFunc] = None,
+        matcher: Optional[MatchFunc] = None,
+        parent=None,
+    ):
+        super().__init__(parent=parent)
+        self.name = name
+        self.runner = runner
+        self.capture = capture
+        self.matcher = matcher
+
+        self._server = QLocalServer(self)
+        self._server.newConnection.connect(self._onNewConnection)
+        self._readers: Dict[QLocalSocket, protocol.MessageReader] = {}
+        # 指标订阅：socket -> (定时器, 请求 id)
+        self._subscriptions: Dict[QLocalSocket, Tuple[QTimer, int]] = {}
+        self._frames = FrameBuffer(f"erchong_{name}")
+
+        self._handlers = {
+            Op.PING: self._ping,
+            Op.CAPTURE: self._capture,
+            Op.MATCH: self._match,
+            Op.TASK_LIST: self._taskList,
+            Op.TASK_START: self._taskStart,
+            Op.TASK_STOP: self._taskStop,
+            Op.SUBSCRIBE_METRICS: self._subscribe,
+        }
+        self._metrics = {
+            "requests": 0,
+            "errors": 0,
+            "request_ms_total": 0.0,
+            "captures": 0,
+            "capture_ms_total": 0.0,
+        }
+
+    def start(self) -> bool:
+        """开始监听，同名的残留套接字会被移除"""
+        QLocalServer.removeServer(self.name)
+        if not self._server.listen(self.name):
+            log.error(f"控制服务启动失败 name:{self.name} {self._server.errorString()}")
+            return False
+        log.info(f"控制服务已启动 path:{self._server.fullServerName()}")
+        return True
+
+    def close(self):
+        """停止监听并释放共享内存"""
+        for socket in list(self._readers):
+            socket.disconnectFromServer()
+        self._server.close()
+        self._frames.close()
+
+    def metrics(self) -> Dict[str, float]:
+        """当前指标"""
+        metrics = dict(self._metrics)
+        metrics["connections"] = len(self._readers)
+        if self.runner is not None:
+            metrics["tasks_running"] = len(self.runner.running())
+        return metrics
+
+    def _onNewConnection(self):
+        while self._server.hasPendingConnections():
+            socket = self._server.nextPendingConnection()
+            self._readers[socket] = protocol.MessageReader()
+            socket.readyRead.connect(lambda s=socket: self._onReadyRead(s))
+            socket.disconnected.connect(lambda s=socket: self._onDisconnected(s))
+
+    def _onDisconnected(self, socket: QLocalSocket):
+        self._readers.pop(socket, None)
+        subscription = self._subscriptions.pop(socket, None)
+        if subscription is not None:
+            subscription[0].stop()
+            subscription[0].deleteLater()
+        socket.deleteLater()
+
+    def _onReadyRead(self, socket: QLocalSocket):
+        reader = self._readers.get(socket)
+        if reader is None:
+            return
+        try:
+            for message in reader.feed(bytes(socket.readAll())):
+                self._dispatch(socket, message)
+        except protocol.ProtocolError as e:
+            log.warning(f"控制连接协议错误，断开连接 {e}")
+            socket.disconnectFromServer()
+
+    def _dispatch(self, socket: QLocalSocket, message: Message):
+        start = time.perf_counter()
+        handler = self._handlers.get(message.op)
+        try:
+            if handler is None:
+                # 未知或服务端不处理的操作码（如新版本客户端的请求）
+                status, payload = Status.UNSUPPORTED, b""
+            else:
+                status, payload = handler(socket, message)
+        except Exception as e:
+            log.exception(f"控制请求失败 op:{protocol.name_of(message.op)}")
+            status, payload = Status.ERROR, protocol.pack_str(str(e))
+
+        socket.write(protocol.pack(message.op, message.requestId, payload, status))
+        socket.flush()
+
+        self._metrics["requests"] += 1
+        if status != Status.OK:
+            self._metrics["errors"] += 1
+        self._metrics["request_ms_total"] += (time.perf_counter() - start) * 1000
+
+    def _grab(self, payload: bytes):
+        if self.capture is None:
+            return None
+        hwnd, normalized, x, y, width, height = protocol.CAPTURE_REQUEST.unpack_from(payload)
+        start = time.perf_counter()
+        frame = self.capture(hwnd, bool(normalized), x, y, width, height)
+        self._metrics["captures"] += 1
+        self._metrics["capture_ms_total"] += (time.perf_counter() - start) * 1000
+        return frame
+
+    def _ping(self, socket, message: Message):
+        return Status.OK, message.payload
+
+    def _capture(self, socket, message: Message):
+        if self.capture is None:
+            return Status.UNSUPPORTED, b""
+        frame = self._grab(message.payload)
+        if frame is None:
+            return Status.ERROR, protocol.pack_str("截图区域为空")
+        return Status.OK, self._frames.write(frame)
+
+    def _match(self, socket, message: Message):
+        if self.capture is None or self.matcher is None:
+            return Status.UNSUPPORTED, b""
+        args, _ = protocol.unpack_str(message.payload, protocol.CAPTURE_REQUEST.size)
+        frame = self._grab(message.payload)
+        if frame is None:
+            return Status.ERROR, protocol.pack_str("截图区域为空")
+        results = self.matcher(frame, args)
+        return Status.OK, protocol.U32.pack(len(results)) + b"".join(
+            protocol.MATCH_RESULT.pack(x, y, score) for x, y, score in results
+        )
+
+    def _taskList(self, socket, message: Message):
+        if self.runner is None:
+            return Status.UNSUPPORTED, b""
+        return Status.OK, protocol.pack_str_list(self.runner.tasks()) + protocol.pack_str_list(
+            self.runner.running()
+        )
+
+    def _taskStart(self, socket, message: Message):
+        if self.runner is None:
+            return Status.UNSUPPORTED, b""
+        name, _ = protocol.unpack_str(message.payload)
+        return (Status.OK if self.runner.start(name) else Status.ERROR), b""
+
+    def _taskStop(self, socket, message: Message):
+        if self.runner is None:
+            return Status.UNSUPPORTED, b""
+        name, _ = protocol.unpack_str(message.payload)
+        return (Status.OK if self.runner.stop(name) else Status.ERROR), b""
+
+    def _subscribe(self, socket: QLocalSocket, message: Message):
+        (interval,) = protocol.SUBSCRIBE.unpack_from(message.payload)
+        subscription = self._subscriptions.pop(socket, None)
+        if subscription is not None:
+            subscription[0].stop()
+            subscription[0].deleteLater()
+        if interval:
+            timer = QTimer(self)
+            timer.timeout.connect(lambda: self._pushMetrics(socket, message.requestId))
+            timer.start(interval)
+            self._subscriptions[socket] = (timer, message.requestId)
+        return Status.OK, protocol.pack_metrics(self.metrics())
+
+    def _pushMetrics(self, socket: QLocalSocket, requestId: int):
+        socket.write(protocol.pack(Op.METRICS, requestId, protocol.pack_metrics(self.metrics())))
+        socket.flush()
@@ -0,0 +1,5 @@
+"""任务模块"""
+
+from .runner import TaskContext, TaskRunner
+
+__all__ = ["TaskContext", "TaskRunner"]
@@ -0,0 +1,170 @@
+"""任务运行器
+
+从文件加载脚本并在独立线程中运行。脚本需要定义 run(ctx) 函数，
+ctx 为 TaskContext，长时间运行的脚本应定期检查 ctx.stopped 或使用
+ctx.sleep()，以便能被停止。
+"""
+
+import importlib.util
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from ..utils.logger import get_logger
+
+log = get_logger()
+
+
+class TaskContext:
+    """脚本运行上下文"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.log = log
+        self._stop = threading.Event()
+
+    @property
+    def stopped(self) -> bool:
+        """是否已请求停止"""
+        return self._stop.is_set()
+
+    def sleep(self, seconds: float) -> bool:
+        """等待指定秒数，期间被停止时提前返回 False"""
+        return not self._stop.wait(seconds)
+
+    def stop(self):
+        self._stop.set()
+
+
+class TaskRunner(QObject):
+    """任务运行器"""
+
+    # 任务名
+    started = pyqtSignal(str)
+    # 任务名
+    finished = pyqtSignal(str)
+    # 任务名, 错误信息
+    failed = pyqtSignal(str, str)
+    # 所有已启动的任务都已结束
+    allFinished = pyqtSignal()
+    # 任务线程退出，排队到运行器所在线程处理
+    _taskExited = pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self._scripts: Dict[str, Callable[[TaskContext], object]] = {}
+        self._running: Dict[str, TaskContext] = {}
+        self._threads: Dict[str, threading.Thread] = {}
+        self._lock = threading.Lock()
+        # 已启动但运行器线程尚未处理其退出的任务数，只在运行器线程中读写
+        self._active = 0
+        self._taskExited.connect(self._onTaskExited)
+
+    def load(self, path: str, name: Optional[str] = None) -> str:
+        """加载脚本文件，返回任务名
+
+        name 默认为文件名，与已加载任务重名时追加序号；显式指定的 name 重名时抛出 ValueError。
+        """
+        file = Path(path)
+        if name is None:
+            name = self._uniqueName(file.stem)
+            if name != file.stem:
+                log.warning(f"任务名 {file.stem} 已被占用，改用 {name} path:{file}")
+        elif name in self._scripts:
+            raise ValueError(f"任务名重复: {name} {file}")
+        spec = importlib.util.spec_from_file_location(f"erchong_task_{name}", file)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"无法加载脚本: {file}")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+
+        run = getattr(module, "run", None)
+        if not callable(run):
+            raise AttributeError(f"脚本缺少 run(ctx) 函数: {file}")
+        self._scripts[name] = run
+        log.info(f"已加载任务 {name} path:{file}")
+        return name
+
+    def _uniqueName(self, base: str) -> str:
+        name = base
+        index = 2
+        while name in self._scripts:
+            name = f"{base}_{index}"
+            index += 1
+        return name
+
+    def tasks(self) -> List[str]:
+        """已加载的任务名"""
+        return list(self._scripts)
+
+    def running(self) -> List[str]:
+        """正在运行的任务名"""
+        with self._lock:
+            return list(self._running)
+
+    def start(self, name: str) -> bool:
+        """启动任务，任务不存在或已在运行时返回 False"""
+        run = self._scripts.get(name)
+        if run is None:
+            log.warning(f"任务不存在 {name}")
+            return False
+        with self._lock:
+            if name in self._running:
+                return False
+            ctx = TaskContext(name)
+            self._running[name] = ctx
+
+            thread = threading.Thread(target=self._run, args=(name, run, ctx), name=f"task-{name}", daemon=True)
+            self._threads[name] = thread
+        self._active += 1
+        thread.start()
+        self.started.emit(name)
+        return True
+
+    def stop(self, name: str) -> bool:
+        """请求停止任务，任务未运行时返回 False"""
+        with self._lock:
+            ctx = self._running.get(name)
+        if ctx is None:
+            return False
+        ctx.stop()
+        return True
+
+    def stopAll(self):
+        """请求停止所有任务"""
+        with self._lock:
+            contexts = list(self._running.values())
+        for ctx in contexts:
+            ctx.stop()
+
+    def join(self, timeout: Optional[float] = None):
+        """等待正在运行的任务结束"""
+        with self._lock:
+            threads = list(self._threads.values())
+        for thread in threads:
+            thread.join(timeout)
+
+    def _run(self, name: str, run: Callable[[TaskContext], object], ctx: TaskContext):
+        log.info(f"任务开始 {name}")
+        try:
+            run(ctx)
+        except Exception as e:
+            log.exception(f"任务失败 {name}")
+            self.failed.emit(name, str(e))
+        else:
+            log.info(f"任务结束 {name}")
+            self.finished.emit(name)
+        finally:
+            with self._lock:
+                self._running.pop(name, None)
+                self._threads.pop(name, None)
+            self._taskExited.emit(name)
+
+    def _onTaskExited(self, name: str):
+        # 在运行器线程中计数：同步连续调用 start() 时，先结束的任务
+        # 不会在后面的任务启动前触发 allFinished
+        self._active -= 1
+        if self._active == 0:
+            self.allFinished.emit()
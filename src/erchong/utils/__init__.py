@@ -2,6 +2,7 @@
 
 from .platform import is_win11
 from .logger import get_logger
+from .image import frame_to_qimage
 
-__all__ = ["is_win11", "get_logger"]
+__all__ = ["is_win11", "get_logger", "frame_to_qimage"]
 
@@ -0,0 +1,37 @@
+"""图像相关工具函数"""
+
+from PyQt5.QtGui import QImage
+
+# 通道数 -> QImage 格式（截图缓冲区为 BGR/BGRA 字节序）
+_CHANNEL_FORMATS = {
+    1: QImage.Format.Format_Grayscale8,
+    3: QImage.Format.Format_BGR888,
+    4: QImage.Format.Format_ARGB32,
+}
+
+
+def frame_to_qimage(frame) -> QImage:
+    """将帧缓冲区转换为 QImage
+
+    frame 可以是 numpy 数组或任何支持缓冲区协议、形状为
+    (高, 宽) 或 (高, 宽, 通道) 的对象，返回的 QImage 持有独立的数据副本。
+    """
+    view = memoryview(frame)
+    if view.ndim == 2:
+        height, width = view.shape
+        channels = 1
+    elif view.ndim == 3:
+        height, width, channels = view.shape
+    else:
+        raise ValueError(f"不支持的帧维度: {view.ndim}")
+
+    fmt = _CHANNEL_FORMATS.get(channels)
+    if fmt is None:
+        raise ValueError(f"不支持的通道数: {channels}")
+
+    if not view.c_contiguous:
+        view = memoryview(view.tobytes()).cast("B", view.shape)
+
+    image = QImage(view, width, height, view.strides[0], fmt)
+    # QImage 不持有外部缓冲区，复制一份以脱离原始帧的生命周期
+    return image.copy()
@@ -0,0 +1,139 @@
+"""日志文件索引
+
+通过 mmap 访问日志文件，增量建立行偏移索引，按需解码单行。
+文件追加后只扫描新增部分，不会重新读取整个文件。
+"""
+
+import mmap
+import os
+import re
+from array import array
+from typing import Optional
+
+# 行首附近的日志级别
+_LEVEL_RE = re.compile(rb"\b(DEBUG|INFO|WARNING|WARN|ERROR|CRITICAL)\b")
+_NEWLINE_RE = re.compile(rb"\n")
+# 只在行首这么多字节内查找级别
+_LEVEL_SEARCH_BYTES = 128
+
+LEVELS = {
+    b"DEBUG": 10,
+    b"INFO": 20,
+    b"WARN": 30,
+    b"WARNING": 30,
+    b"ERROR": 40,
+    b"CRITICAL": 50,
+}
+
+
+class LogIndex:
+    """日志文件的行偏移索引"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+        self._mmap: Optional[mmap.mmap] = None
+        # 每个完整行的起始偏移，最后一项为下一行（未完成）的起始偏移
+        self._offsets = array("Q", [0])
+        # 每行的级别，续行（如异常堆栈）沿用上一行的级别
+        self._levels = array("B")
+        self._lastLevel = 0
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    @property
+    def indexedBytes(self) -> int:
+        return self._offsets[-1]
+
+    def update(self, maxBytes: int = 2 << 20) -> int:
+        """索引新追加的内容，最多扫描 maxBytes 字节，返回新增行数
+
+        文件变短（被截断或轮转）时清空索引，返回 -1。
+        """
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            return 0
+        if size < self.indexedBytes:
+            self.reset()
+            return -1
+        if size == self.indexedBytes:
+            return 0
+
+        if self._mmap is None or len(self._mmap) < size:
+            self._remap()
+        mm = self._mmap
+        if mm is None:
+            return 0
+
+        start = self.indexedBytes
+        end = min(len(mm), start + maxBytes)
+        before = len(self)
+        lineStart = start
+        for match in _NEWLINE_RE.finditer(mm, start, end):
+            lineEnd = match.end()
+            self._offsets.append(lineEnd)
+            self._levels.append(self._detectLevel(mm, lineStart, lineEnd))
+            lineStart = lineEnd
+
+        if lineStart == start and end < len(mm):
+            # 单行超过 maxBytes，直接找到行尾，避免索引停滞
+            lineEnd = mm.find(b"\n", end)
+            if lineEnd != -1:
+                self._offsets.append(lineEnd + 1)
+                self._levels.append(self._detectLevel(mm, start, lineEnd + 1))
+        return len(self) - before
+
+    def hasPending(self) -> bool:
+        """文件中是否还有未索引的内容（不含末尾未完成的行）"""
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            return False
+        if self._mmap is None or len(self._mmap) < size:
+            return size > self.indexedBytes
+        return self._mmap.find(b"\n", self.indexedBytes) != -1
+
+    def raw(self, row: int) -> bytes:
+        """第 row 行的原始字节（不含换行）"""
+        return self._mmap[self._offsets[row]:self._offsets[row + 1]].rstrip(b"\r\n")
+
+    def line(self, row: int) -> str:
+        """第 row 行的文本"""
+        return self.raw(row).decode("utf-8", errors="replace")
+
+    def level(self, row: int) -> int:
+        """第 row 行的级别，无法识别时为 0"""
+        return self._levels[row]
+
+    def reset(self):
+        """清空索引"""
+        self.close()
+        self._offsets = array("Q", [0])
+        self._levels = array("B")
+        self._lastLevel = 0
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _remap(self):
+        if self._file is None:
+            self._file = open(self.path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        if size == 0:
+            return
+        if self._mmap is not None:
+            self._mmap.close()
+        self._mmap = mmap.mmap(self._file.fileno(), size, access=mmap.ACCESS_READ)
+
+    def _detectLevel(self, mm: mmap.mmap, start: int, end: int) -> int:
+        match = _LEVEL_RE.search(mm, start, min(end, start + _LEVEL_SEARCH_BYTES))
+        if match is not None:
+            self._lastLevel = LEVELS[match.group(1)]
+        return self._lastLevel
@@ -5,6 +5,7 @@ from .home_widget import HomeWidget
 from .image_card_widget import ImageCardWidget, MicaWindow
 from .settings_widget import SettingsWidget
 from .hwnd_list_widget import HwndListWidget
+from .log_viewer_widget import LogViewerWidget
 
 __all__ = [
     "HomeWidget",
@@ -13,4 +14,5 @@ __all__ = [
     "ImageCardWidget",
     "MicaWindow",
     "HwndListWidget",
+    "LogViewerWidget",
 ]
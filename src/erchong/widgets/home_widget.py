@@ -28,6 +28,7 @@ from qfluentwidgets import (
 
 import qframelesswindow as qfw
 import qfluentwidgets as qf
+from src.erchong.common.window_manager import windowManager
 from ..config.settings import RESOURCE_DIR
 from ..utils.platform import is_win11
 from .image_card_widget import ImageCardWidget
@@ -50,6 +51,8 @@ class HomeWidget(QWidget):
     def __init__(self, objectName: str, parent=None):
         super().__init__(parent=parent)
         self.setObjectName(objectName)
+        # 截图目标窗口，0 表示整个桌面
+        self.targetHwnd = 0
         self.setup_ui()
 
     def setup_ui(self):
@@ -107,9 +110,18 @@ class HomeWidget(QWidget):
 
     def open(self):
         """打开图片卡片窗口"""
-        widget = ImageCardWidget(self)
-        widget.show()
+        widget = windowManager.open(ImageCardWidget)
+        widget.setTargetHwnd(self.targetHwnd)
 
     def openHwnd(self):
+        """打开窗口句柄列表"""
+        windowManager.open(HwndListWidget, self._createHwndListWidget)
+
+    def _createHwndListWidget(self) -> HwndListWidget:
         widget = HwndListWidget()
-        widget.show()
+        widget.selected_hwnd.connect(self.setTargetHwnd)
+        return widget
+
+    def setTargetHwnd(self, hwnd: int):
+        """设置截图目标窗口"""
+        self.targetHwnd = hwnd
@@ -34,6 +34,9 @@ class MicaWindow(qfr.FramelessWindow):
 
 
 class HwndListWidget(MicaWindow):
+    # 双击选中的窗口句柄
+    selected_hwnd = qtCore.pyqtSignal(int)
+
     def __init__(self):
         super().__init__()
         self._windows = []  # list of (hwnd:int, title:str)
@@ -47,6 +50,18 @@ class HwndListWidget(MicaWindow):
     def setQss(self):
         self.setStyleSheet(cfg.getQssFile("hwnd_list_widget"))
 
+    def releaseResources(self):
+        """关闭时由窗口管理器调用"""
+        cfg.themeChanged.disconnect(self.setQss)
+        self._windows = []
+        self.list_widget.clear()
+
+    def restoreResources(self):
+        """从暖池复用时由窗口管理器调用"""
+        cfg.themeChanged.connect(self.setQss)
+        self.setQss()
+        self.refresh()
+
     def _setup_ui(self):
         self.setWindowTitle("Window Handle List")
         self.resize(800, 600)
@@ -1,16 +1,11 @@
 """图片卡片组件"""
 
-import os
-import time
 from typing import TYPE_CHECKING
 from src.erchong.common.config import cfg
 
-import win32gui
 from PyQt5.QtCore import Qt, QEasingCurve
 from PyQt5.QtWidgets import QVBoxLayout, QWidget
 
-import gas.util.img_util as img_util
-import gas.util.screenshot_util as screenshot_util
 from qfluentwidgets import (
     ImageLabel,
     MSFluentTitleBar,
@@ -20,7 +15,11 @@ from qfluentwidgets import (
     isDarkTheme,
 )
 
+from ..capture import get_exporter
+from ..capture.geometry import FULL_CLIENT, Roi, get_geometry_cache
+from ..capture.screen import capture_rect, capture_rois
 from ..config.settings import QT_QSS_DIR, RESOURCE_DIR
+from ..utils.image import frame_to_qimage
 from ..utils.platform import is_win11
 
 if TYPE_CHECKING:
@@ -54,6 +53,12 @@ class ImageCardWidget(MicaWindow):
     def __init__(self, parent=None):
         super().__init__()
 
+        # 截图目标窗口及区域，hwnd 为 0 时截取桌面固定区域
+        self.targetHwnd = 0
+        self.roi = FULL_CLIENT
+        # 截图生成的标签，关闭时释放
+        self._captureLabels = []
+
         self.imageLabel = ImageLabel(str(RESOURCE_DIR / "shoko1.jpg"),self)
         self.gifLabel = ImageLabel(str(RESOURCE_DIR / "shoko2.jpg"),self)
         self.vBoxLayout = QVBoxLayout(self)
@@ -82,15 +87,45 @@ class ImageCardWidget(MicaWindow):
 
     def setQss(self):
         self.setStyleSheet(cfg.getQssFile("image_card_widget"))
-        
+
+    def releaseResources(self):
+        """关闭时由窗口管理器调用"""
+        cfg.themeChanged.disconnect(self.setQss)
+        for label in self._captureLabels:
+            self.viewLayout.removeWidget(label)
+            label.deleteLater()
+        self._captureLabels.clear()
+
+    def restoreResources(self):
+        """从暖池复用时由窗口管理器调用"""
+        cfg.themeChanged.connect(self.setQss)
+        self.setQss()
+
+    def setTargetHwnd(self, hwnd: int, roi: Roi = FULL_CLIENT):
+        """设置截图目标窗口和客户区区域"""
+        self.targetHwnd = hwnd
+        self.roi = roi
 
     def capture(self):
         """截图功能"""
-        screenshot = screenshot_util.screenshot_bitblt(
-            win32gui.GetDesktopWindow(), (500, 500, 700, 700)
-        )
-        f = f"{int(time.time())}.png"
-        img_util.save_img(screenshot, f)
-        label = ImageLabel(f)
+        if self.targetHwnd:
+            screenshot = capture_rois(self.targetHwnd, (self.roi,))[0]
+            if screenshot is None:
+                log.warning(f"截图区域为空 hwnd:{self.targetHwnd:#010x}")
+                if get_geometry_cache().get(self.targetHwnd) is None:
+                    # 目标窗口已关闭，之后改为截取桌面
+                    self.targetHwnd = 0
+                return
+        else:
+            screenshot = capture_rect((500, 500, 700, 700))
+        # 直接从内存显示，不经过 PNG 文件
+        label = ImageLabel(frame_to_qimage(screenshot))
         self.viewLayout.addWidget(label)
-        os.remove(f)
+        self._captureLabels.append(label)
+
+        if cfg.get(cfg.saveScreenshot):
+            # 编码与写入在后台完成，队列满时丢弃本帧而不阻塞界面
+            if not get_exporter().submit(
+                screenshot, cfg.get(cfg.screenshotFolder), cfg.getExportOptions()
+            ):
+                log.warning("截图导出队列已满，本次截图未保存")
@@ -0,0 +1,222 @@
+"""日志查看组件"""
+
+import logging
+from array import array
+from typing import Optional
+
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, Qt, QTimer
+from PyQt5.QtGui import QFontDatabase
+from PyQt5.QtWidgets import QHBoxLayout, QVBoxLayout, QWidget
+
+from qfluentwidgets import BodyLabel, CheckBox, ComboBox, ListView, SearchLineEdit
+
+from src.erchong.common.governor import governor
+
+from ..config.settings import LOG_DIR
+from ..utils.log_index import LogIndex
+from ..utils.logger import get_logger
+
+# 级别筛选选项：(显示文本, 最低级别)
+LEVEL_OPTIONS = [
+    ("全部", 0),
+    ("DEBUG", logging.DEBUG),
+    ("INFO", logging.INFO),
+    ("WARNING", logging.WARNING),
+    ("ERROR", logging.ERROR),
+]
+
+# 每次处理的过滤行数，保证单次事件循环耗时可控
+FILTER_CHUNK_LINES = 50000
+
+
+def debug_log_path() -> str:
+    """app 日志器中级别最低的日志文件"""
+    handlers = [h for h in get_logger().handlers if isinstance(h, logging.FileHandler)]
+    if handlers:
+        return min(handlers, key=lambda h: h.level).baseFilename
+    return str(LOG_DIR / "debug.log")
+
+
+class LogListModel(QAbstractListModel):
+    """日志行模型，只在视图请求时解码可见行"""
+
+    def __init__(self, index: LogIndex, parent=None):
+        super().__init__(parent=parent)
+        self._index = index
+        # 已暴露给视图的索引行数
+        self._count = 0
+        # 过滤后的行号，None 表示不过滤
+        self._rows: Optional[array] = None
+        # 过滤已扫描到的索引行
+        self._scanned = 0
+        self._minLevel = 0
+        self._needle = b""
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._rows) if self._rows is not None else self._count
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        row = self._rows[index.row()] if self._rows is not None else index.row()
+        return self._index.line(row)
+
+    def setFilter(self, minLevel: int, text: str):
+        """设置过滤条件，匹配行在之后的 sync() 中逐批加入"""
+        self.beginResetModel()
+        self._minLevel = minLevel
+        self._needle = text.encode("utf-8").lower()
+        self._rows = array("Q") if minLevel or self._needle else None
+        self._scanned = 0
+        self._count = 0
+        self.endResetModel()
+
+    def clear(self):
+        """索引被重建时清空"""
+        self.setFilter(self._minLevel, self._needle.decode("utf-8"))
+
+    def isFiltering(self) -> bool:
+        return self._rows is not None
+
+    def hasPending(self) -> bool:
+        """是否还有已索引但未处理的行"""
+        if self._rows is None:
+            return self._count < len(self._index)
+        return self._scanned < len(self._index)
+
+    def sync(self) -> bool:
+        """把新索引的行加入模型，返回是否还有未处理的行"""
+        total = len(self._index)
+        if self._rows is None:
+            if total > self._count:
+                self.beginInsertRows(QModelIndex(), self._count, total - 1)
+                self._count = total
+                self.endInsertRows()
+            return False
+
+        end = min(total, self._scanned + FILTER_CHUNK_LINES)
+        matched = array("Q")
+        for row in range(self._scanned, end):
+            if self._index.level(row) < self._minLevel:
+                continue
+            if self._needle and self._needle not in self._index.raw(row).lower():
+                continue
+            matched.append(row)
+        self._scanned = end
+
+        if matched:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(matched) - 1)
+            self._rows.extend(matched)
+            self.endInsertRows()
+        return self._scanned < total
+
+
+class LogViewerWidget(QWidget):
+    """日志查看页面
+
+    mmap 日志文件并增量建立行索引，列表只渲染可见行；
+    页面显示时跟踪文件追加，隐藏时停止。
+    """
+
+    def __init__(self, objectName: str, parent=None, path: str = ""):
+        super().__init__(parent=parent)
+        self.setObjectName(objectName)
+
+        self.index = LogIndex(path or debug_log_path())
+        self.model = LogListModel(self.index, self)
+
+        # 检查文件追加
+        self._tailTimer = QTimer(self)
+        self._tailTimer.setInterval(500)
+        self._tailTimer.timeout.connect(self._poll)
+        governor.registerTimer(self._tailTimer, backgroundInterval=2000)
+
+        # 分批索引和过滤，每批之间让出事件循环
+        self._workTimer = QTimer(self)
+        self._workTimer.setInterval(0)
+        self._workTimer.timeout.connect(self._work)
+
+        # 搜索输入防抖
+        self._filterTimer = QTimer(self)
+        self._filterTimer.setSingleShot(True)
+        self._filterTimer.setInterval(300)
+        self._filterTimer.timeout.connect(self._applyFilter)
+
+        self.setup_ui()
+
+    def setup_ui(self):
+        """设置界面"""
+        self.levelComboBox = ComboBox(self)
+        self.levelComboBox.addItems([text for text, _ in LEVEL_OPTIONS])
+        self.levelComboBox.setFixedWidth(120)
+        self.levelComboBox.currentIndexChanged.connect(self._applyFilter)
+
+        self.searchEdit = SearchLineEdit(self)
+        self.searchEdit.setPlaceholderText("过滤日志内容")
+        self.searchEdit.textChanged.connect(lambda: self._filterTimer.start())
+
+        self.followCheckBox = CheckBox("跟随", self)
+        self.followCheckBox.setChecked(True)
+
+        self.listView = ListView(self)
+        # 统一行高，视图只为可见行请求数据
+        self.listView.setUniformItemSizes(True)
+        self.listView.setFont(QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont))
+        self.listView.setModel(self.model)
+
+        self.statusLabel = BodyLabel("", self)
+
+        topLayout = QHBoxLayout()
+        topLayout.addWidget(self.levelComboBox)
+        topLayout.addWidget(self.searchEdit, 1)
+        topLayout.addWidget(self.followCheckBox)
+
+        layout = QVBoxLayout(self)
+        layout.addLayout(topLayout)
+        layout.addWidget(self.listView)
+        layout.addWidget(self.statusLabel)
+
+    def showEvent(self, e):
+        super().showEvent(e)
+        self._tailTimer.start()
+        self._poll()
+
+    def hideEvent(self, e):
+        super().hideEvent(e)
+        self._tailTimer.stop()
+        self._workTimer.stop()
+
+    def _applyFilter(self):
+        minLevel = LEVEL_OPTIONS[self.levelComboBox.currentIndex()][1]
+        self.model.setFilter(minLevel, self.searchEdit.text().strip())
+        self._workTimer.start()
+
+    def _poll(self):
+        if self._workTimer.isActive():
+            return
+        if self.index.hasPending() or self.model.hasPending():
+            self._workTimer.start()
+
+    def _work(self):
+        if self.index.update() < 0:
+            # 文件被截断或轮转
+            self.model.clear()
+            self.index.update()
+
+        more = self.model.sync()
+        if self.followCheckBox.isChecked():
+            self.listView.scrollToBottom()
+        if not more and not self.index.hasPending():
+            self._workTimer.stop()
+        self._updateStatus(more)
+
+    def _updateStatus(self, busy: bool):
+        text = f"{len(self.index):,} 行"
+        if self.model.isFiltering():
+            text = f"{self.model.rowCount():,} / {text}"
+        if busy or self._workTimer.isActive():
+            text += "（处理中…）"
+        self.statusLabel.setText(text)
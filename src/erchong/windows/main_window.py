@@ -11,8 +11,10 @@ from qfluentwidgets import (
 )
 from qfluentwidgets import FluentIcon as FIF
 
+from src.erchong.common.governor import governor
+
 from ..config.settings import WINDOW_HEIGHT, WINDOW_TITLE, WINDOW_WIDTH
-from ..widgets import GalleryCard, HomeWidget, SettingsWidget
+from ..widgets import GalleryCard, HomeWidget, LogViewerWidget, SettingsWidget
 
 
 class MainWindow(MSFluentWindow):
@@ -28,8 +30,10 @@ class MainWindow(MSFluentWindow):
         # 创建子界面
         self.homeInterface = HomeWidget("Home Interface", self)
         self.settingsInterface = SettingsWidget("Setting Interface", self)
+        self.logInterface = LogViewerWidget("Log Interface", self)
 
         self.addSubInterface(self.homeInterface, FIF.HOME, "主页", FIF.HOME_FILL)
+        self.addSubInterface(self.logInterface, FIF.DOCUMENT, "日志")
 
         self.navigationInterface.addItem(
             routeKey="theme",
@@ -61,6 +65,9 @@ class MainWindow(MSFluentWindow):
             w, h = geometry.width(), geometry.height()
             self.move(w // 2 - self.width() // 2, h // 2 - self.height() // 2)
 
+        # 根据主窗口的显示状态调节后台工作
+        governor.watch(self)
+
     def switchTheme(self):
         """切换主题"""
         if isDarkTheme():
@@ -0,0 +1,19 @@
+"""测试公共设置"""
+
+import os
+import tempfile
+
+_cwd = None
+
+
+def pytest_configure(config):
+    # 日志器使用相对路径 logs/，与 benchmarks 一样切换到临时目录以免污染工作区；
+    # 子进程（如控制服务）继承该目录
+    global _cwd
+    _cwd = os.getcwd()
+    os.chdir(tempfile.mkdtemp(prefix="erchong-test-"))
+
+
+def pytest_unconfigure(config):
+    if _cwd is not None:
+        os.chdir(_cwd)
@@ -0,0 +1,58 @@
+"""配置持久化测试"""
+
+import json
+
+import pytest
+
+qf = pytest.importorskip("qfluentwidgets")
+
+from src.erchong.common.config_persister import ConfigPersister  # noqa: E402
+
+
+class _Config(qf.QConfig):
+    quality = qf.RangeConfigItem("Screenshot", "Quality", 90, qf.RangeValidator(0, 100))
+    save = qf.ConfigItem("Screenshot", "SaveScreenshot", False, qf.BoolValidator())
+
+
+@pytest.fixture
+def persister(tmp_path):
+    # 配置项是类属性，每个测试前恢复默认值
+    _Config.quality.value = 90
+    _Config.save.value = False
+    config = _Config()
+    config.file = tmp_path / "config.json"
+    return ConfigPersister(config)
+
+
+def _write(persister, data: dict):
+    with open(persister.file, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+
+def test_reload_applies_changed_values(persister):
+    _write(persister, {"Screenshot": {"Quality": 50, "SaveScreenshot": True}})
+
+    changed = persister.reload()
+
+    assert sorted(changed) == ["Screenshot.Quality", "Screenshot.SaveScreenshot"]
+    assert _Config.quality.value == 50
+    assert _Config.save.value is True
+
+
+def test_reload_skips_wrongly_typed_value(persister):
+    _write(persister, {"Screenshot": {"Quality": "x", "SaveScreenshot": False}})
+    _Config.save.value = True
+
+    changed = persister.reload()
+
+    # 类型错误的键被忽略，其他键照常重载
+    assert changed == ["Screenshot.SaveScreenshot"]
+    assert _Config.quality.value == 90
+    assert _Config.save.value is False
+
+
+def test_reload_limits_to_requested_keys(persister):
+    _write(persister, {"Screenshot": {"Quality": 10, "SaveScreenshot": True}})
+
+    assert persister.reload(["Screenshot.Quality"]) == ["Screenshot.Quality"]
+    assert _Config.save.value is False
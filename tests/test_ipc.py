@@ -0,0 +1,135 @@
+"""本地控制接口往返测试
+
+服务端运行在独立进程中（与外部工具调用守护进程的方式相同），
+使用合成截图函数，因此在 Linux 上无需真实窗口即可运行。
+"""
+
+import multiprocessing
+import os
+import signal
+import time
+import uuid
+
+import pytest
+
+pytest.importorskip("PyQt5.QtNetwork")
+
+from src.erchong.ipc import ControlClient, ControlError, Status  # noqa: E402
+
+TASK_SCRIPT = """
+def run(ctx):
+    while ctx.sleep(0.01):
+        pass
+"""
+
+
+def synthetic_capture(hwnd, normalized, x, y, width, height):
+    """按请求尺寸生成 BGRA 帧，像素值为 (列 + 行) & 0xFF，空区域返回 None"""
+    width, height = int(width), int(height)
+    if width <= 0 or height <= 0:
+        return None
+    data = bytearray(width * height * 4)
+    for row in range(height):
+        value = bytes(((col + row) & 0xFF for col in range(width) for _ in range(4)))
+        data[row * width * 4:(row + 1) * width * 4] = value
+    return memoryview(data).cast("B", (height, width, 4))
+
+
+def serve(name: str, script: str, ready):
+    """服务端进程：运行控制服务直到被终止"""
+    from src.erchong.daemon import create_core_app
+    from src.erchong.ipc import ControlServer
+    from src.erchong.tasks import TaskRunner
+
+    app = create_core_app([])
+    runner = TaskRunner(app)
+    runner.load(script, "loop")
+    server = ControlServer(name, runner, synthetic_capture, parent=app)
+    if server.start():
+        ready.set()
+    app.aboutToQuit.connect(server.close)
+    app.exec_()
+
+
+@pytest.fixture(scope="module")
+def client(tmp_path_factory):
+    script = tmp_path_factory.mktemp("tasks") / "loop.py"
+    script.write_text(TASK_SCRIPT, encoding="utf-8")
+
+    name = f"erchong_test_{uuid.uuid4().hex[:8]}"
+    context = multiprocessing.get_context("spawn")
+    ready = context.Event()
+    process = context.Process(target=serve, args=(name, str(script), ready), daemon=True)
+    process.start()
+    try:
+        assert ready.wait(30), "控制服务未能启动"
+        with ControlClient(name) as client:
+            yield client
+    finally:
+        # Ctrl+C 让服务端正常退出并释放共享内存
+        os.kill(process.pid, signal.SIGINT)
+        process.join(5)
+
+
+def test_ping_echoes_payload(client):
+    assert client.ping(b"hello") == b"hello"
+
+
+def test_capture_reads_frame_from_shared_memory(client):
+    frame = client.capture(0, 0, 0, 64, 32)
+    assert (frame.width, frame.height, frame.channels, frame.stride) == (64, 32, 4, 256)
+    assert frame.data[0] == 0
+    # 第 3 行第 5 列
+    assert frame.data[3 * frame.stride + 5 * 4] == 8
+
+    sequence = frame.sequence
+    frame = client.capture(0, 0, 0, 16, 16)
+    assert frame.sequence == sequence + 1
+    assert (frame.width, frame.height) == (16, 16)
+
+
+def test_empty_capture_is_an_error(client):
+    with pytest.raises(ControlError) as info:
+        client.capture(0, 0, 0, 0, 0)
+    assert info.value.status == Status.ERROR
+
+
+def test_match_without_matcher_is_unsupported(client):
+    with pytest.raises(ControlError) as info:
+        client.match(0, 0, 0, 8, 8, "template")
+    assert info.value.status == Status.UNSUPPORTED
+
+
+def test_unknown_opcode_is_unsupported_and_keeps_connection(client):
+    with pytest.raises(ControlError) as info:
+        client.call(200, b"future request")
+    assert info.value.status == Status.UNSUPPORTED
+    assert client.ping(b"still here") == b"still here"
+
+
+def test_task_start_and_stop(client):
+    loaded, running = client.tasks()
+    assert loaded == ["loop"]
+    assert running == []
+
+    client.startTask("loop")
+    assert client.tasks()[1] == ["loop"]
+
+    client.stopTask("loop")
+    deadline = time.monotonic() + 5
+    while client.tasks()[1] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert client.tasks()[1] == []
+
+    with pytest.raises(ControlError):
+        client.stopTask("loop")
+
+
+def test_metrics_subscription_pushes(client):
+    metrics = client.subscribeMetrics(20)
+    assert metrics["requests"] > 0
+    assert metrics["connections"] == 1
+
+    pushed = client.readMetrics(timeout=2000)
+    assert pushed["requests"] >= metrics["requests"]
+    client.subscribeMetrics(0)
@@ -0,0 +1,39 @@
+"""任务运行器测试"""
+
+import pytest
+
+pytest.importorskip("PyQt5.QtCore")
+
+from src.erchong.tasks import TaskRunner  # noqa: E402
+
+SCRIPT = """
+def run(ctx):
+    pass
+"""
+
+
+@pytest.fixture
+def runner():
+    return TaskRunner()
+
+
+def _script(path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(SCRIPT, encoding="utf-8")
+    return str(path)
+
+
+def test_same_file_name_gets_unique_task_name(runner, tmp_path):
+    first = runner.load(_script(tmp_path / "a" / "run.py"))
+    second = runner.load(_script(tmp_path / "b" / "run.py"))
+
+    assert (first, second) == ("run", "run_2")
+    assert runner.tasks() == ["run", "run_2"]
+
+
+def test_explicit_duplicate_name_is_rejected(runner, tmp_path):
+    runner.load(_script(tmp_path / "a.py"), "task")
+
+    with pytest.raises(ValueError):
+        runner.load(_script(tmp_path / "b.py"), "task")
+    assert runner.tasks() == ["task"]